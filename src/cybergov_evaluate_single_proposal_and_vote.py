@@ -1,112 +1,165 @@
 import sys
 import json
+import orjson
+import asyncio
 import datetime
 import s3fs
 import os
 import hashlib
-
-from utils.helpers import setup_logging, get_config_from_env, hash_file
-from utils.run_magi_eval import run_single_inference, setup_compiled_agent
+import functools
+
+from utils.helpers import setup_logging, get_config_from_env, hash_bytes
+from utils.run_magi_eval import (
+    MAGI_PROMPT_VERSION,
+    run_single_inference,
+    setup_compiled_agent,
+)
 from pathlib import Path
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from jinja2 import Environment, FileSystemLoader
 
 logger = setup_logging()
 
+REQUIRED_RAW_SUBSQUARE_ATTRS = frozenset({"referendumIndex", "title", "content", "proposer"})
+
+SYSTEM_PROMPTS_DIR = Path(__file__).resolve().parent.parent / "templates" / "system_prompts"
+
+# Compiled once at import, renders are then a plain function call
+SUMMARY_RATIONALE_TEMPLATE = Environment(
+    loader=FileSystemLoader(Path(__file__).parent.parent / "templates"),
+    autoescape=True,
+    keep_trailing_newline=True,
+).get_template("summary_rationale.html.j2")
+
+# TODO maybe pick from a random list?
+MAGI_LLMS = {
+    "balthazar": "openrouter/openai/gpt-5",
+    "melchior": "openrouter/google/gemini-2.5-pro-preview",
+    "caspar": "openrouter/anthropic/claude-sonnet-4",
+}
+
+MAGI_MAX_CONCURRENCY = 3
+
+INFERENCE_CACHE_TTL = datetime.timedelta(days=7)
+
+# Prediction fields persisted by the inference cache
+CACHED_PREDICTION_FIELDS = (
+    "critical_analysis",
+    "factors_considered",
+    "scores",
+    "decision_trace",
+    "safety_flags",
+    "vote",
+    "rationale",
+)
+
+# ABSTAIN or any other value normalizes to "Abstain"
+_NORMALIZE_DECISION = {"AYE": "Aye", "NAY": "Nay"}
+
+
+def write_json_output(path, data):
+    """
+    Writes data as indented JSON.
+    """
+    path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+
 
-def load_magi_personalities() -> dict[str, str]:
+def _utc_now_iso():
+    return datetime.datetime.now(datetime.timezone.utc).isoformat()
+
+
+def load_magi_personalities(system_prompts_dir=None) -> dict[str, str]:
     """
     Load Magi personalities from system prompt files.
-    
+    Prompts are static per deployment, so they are read once and cached.
+
     Returns:
         dict: Dictionary mapping magi names to their personality descriptions
+
+    Raises:
+        FileNotFoundError: If one of the system prompt files is missing
     """
+    if system_prompts_dir is None:
+        system_prompts_dir = SYSTEM_PROMPTS_DIR
+    return _read_magi_personalities(Path(system_prompts_dir).resolve())
+
+
+@functools.lru_cache(maxsize=1)
+def _read_magi_personalities(system_prompts_dir: Path) -> dict[str, str]:
     personalities = {}
-    system_prompts_dir = Path(__file__).parent.parent / "templates" / "system_prompts"
-    
+
     magi_names = ["balthazar", "melchior", "caspar"]
-    
+
+    # One directory scan checks all the prompts instead of a stat per file
+    with os.scandir(system_prompts_dir) as entries:
+        present = {entry.name for entry in entries if entry.is_file()}
+    missing = sorted(
+        f"{magi_name}_system_prompt.md"
+        for magi_name in magi_names
+        if f"{magi_name}_system_prompt.md" not in present
+    )
+    if missing:
+        logger.error(f"Something went wrong finding {', '.join(missing)}")
+        raise FileNotFoundError(f"System prompt file not found: {', '.join(missing)}")
+
     for magi_name in magi_names:
         prompt_file = system_prompts_dir / f"{magi_name}_system_prompt.md"
-        try:
-            if prompt_file.exists():
-                with open(prompt_file, 'r', encoding='utf-8') as f:
-                    content = f.read().strip()
-                    personalities[magi_name] = content
-                logger.info(f"✅ Loaded {magi_name} personality from {prompt_file}")
-            else:
-                logger.warning(f"⚠️ System prompt file not found: {prompt_file}")
-        except Exception as e:
-            logger.error(f"❌ Error loading {magi_name} personality: {e}")
-    
+        with open(prompt_file, 'r', encoding='utf-8') as f:
+            personalities[magi_name] = f.read().strip()
+        logger.info(f"✅ Loaded {magi_name} personality from {prompt_file}")
+
     return personalities
 
 
 def generate_summary_rationale(
-    votes_breakdown, proposal_id, network, analysis_files
+    votes_breakdown, proposal_id, network, parsed_analyses: dict[str, dict]
 ) -> str:
     """
     Placeholder for the LLM call to generate a summary rationale.
+    `parsed_analyses` maps each Magi name to its already parsed analysis data.
     """
     logger.info("--> Generatign simple concatenated rationale...")
     github_run_id = os.getenv("GITHUB_RUN_ID", "N/A")
-    aye_votes = sum(1 for v in votes_breakdown if v["decision"].upper() == "AYE")
-    nay_votes = sum(1 for v in votes_breakdown if v["decision"].upper() == "NAY")
-    abstain_votes = sum(
-        1 for v in votes_breakdown if v["decision"].upper() == "ABSTAIN"
-    )
+    vote_counts = Counter(v["decision"].upper() for v in votes_breakdown)
+    aye_votes = vote_counts["AYE"]
+    nay_votes = vote_counts["NAY"]
+    abstain_votes = vote_counts["ABSTAIN"]
+
+    balthazar = parsed_analyses.get("balthazar", {})
+    melchior = parsed_analyses.get("melchior", {})
+    caspar = parsed_analyses.get("caspar", {})
 
-    balthazar_rationale, balthazar_decision = None, None
-    melchior_rationale, melchior_decision = None, None
-    caspar_rationale, caspar_decision = None, None
-
-    for analysis_file in analysis_files:
-        with open(analysis_file, "r") as f:
-            data = json.load(f)
-
-        # Use the .name attribute of the Path object for comparison
-        if analysis_file.name == "balthazar.json":
-            balthazar_rationale = data['rationale']
-            balthazar_decision = data["decision"]
-        elif analysis_file.name == "melchior.json":
-            melchior_rationale = data['rationale']
-            melchior_decision = data["decision"]
-        elif analysis_file.name == "caspar.json":
-            caspar_rationale = data['rationale']
-            caspar_decision = data["decision"]
+    balthazar_rationale, balthazar_decision = balthazar.get("rationale"), balthazar.get("decision")
+    melchior_rationale, melchior_decision = melchior.get("rationale"), melchior.get("decision")
+    caspar_rationale, caspar_decision = caspar.get("rationale"), caspar.get("decision")
 
     ## TODO get the vote number in here to inform people that this might not be the first vote (old links will go stale)
     # requires a way to edit old proposal comments, maybe for later
-    summary_text = f"""
-<p>A panel of autonomous agents reviewed this proposal, resulting in a vote of <strong>{aye_votes} AYE</strong>, <strong>{nay_votes} NAY</strong>, and <strong>{abstain_votes} ABSTAIN</strong>.</p>
-<h3 style="display: inline;">Balthazar voted <u>{balthazar_decision}</u></h3>
-<blockquote>{balthazar_rationale}</blockquote>
-<h3 style="display: inline;">Melchior voted <u>{melchior_decision}</u></h3>
-<blockquote>{melchior_rationale}</blockquote>
-<h3 style="display: inline;">Caspar voted <u>{caspar_decision}</u></h3>
-<blockquote>{caspar_rationale}</blockquote>
-<h3>Feedback</h3>
-<p>Help improve the system by letting us know if the analysis was helpful:</p>
-<ul>
-    <li><a href="https://docs.google.com/forms/d/e/1FAIpQLSdEvZEUzccs58Ez49l0RSJnuRFed2wR_QstxbrJLbOosndowg/viewform?usp=pp_url&entry.799132028=https://{network}.subsquare.io/referenda/{proposal_id}&entry.1205216491=Agree+with+the+vote&entry.1493217809=Just+right" target="_blank">👍 Helpful</a></li>
-    <li><a href="https://docs.google.com/forms/d/e/1FAIpQLSdEvZEUzccs58Ez49l0RSJnuRFed2wR_QstxbrJLbOosndowg/viewform?usp=pp_url&entry.799132028=https://{network}.subsquare.io/referenda/{proposal_id}&entry.1205216491=Disagree+with+the+vote&entry.1493217809=One+of+the+LLMs+goofed+completely" target="_blank">👎 Unhelpful</a></li>
-</ul>
-<h3>System Transparency</h3>
-<p>To ensure full transparency, all data and processes related to this vote are publicly available:</p>
-<ul>
-    <li><strong>Manifest File:</strong> <a href="https://cybergov.b-cdn.net/proposals/{network}/{proposal_id}/manifest.json">View the full inputs and outputs.</a></li>
-    <li><strong>Execution Log:</strong> <a href="https://github.com/KarimJedda/cybergov/actions/runs/{github_run_id}">Verify the public GitHub pipeline run and compare the manifest.json hash.</a></li>
-    <li><strong>Source Content:</strong> <a href="https://cybergov.b-cdn.net/proposals/{network}/{proposal_id}/content.md">Read the content provided to the agents.</a></li>
-    <li><strong>Read about how this works:</strong> <a href="https://forum.polkadot.network/t/cybergov-v0-automating-trust-verifiable-llm-governance-on-polkadot/14796">Technical write-up.</a></li>
-    <li><strong>Request a re-vote:</strong> <a href="https://github.com/KarimJedda/cybergov/issues">Cybergov public issue tracker.</a></li>
-</ul>
-<hr>
-<h3>A Note on This System</h3>
-<p>Please be aware that this analysis was produced by Large Language Models (LLMs). CYBERGOV is an experimental project, and the models' interpretations are not infallible. They can make mistakes or overlook nuance. They also <strong>currently lack historical context</strong>, work is underway to extend CYBERGOV with embeddings and more. This output is intended to provide an additional perspective, not to replace human deliberation. We encourage community feedback to help improve the system.</p>
-<p>Further details on the project are available at the <a href="https://github.com/KarimJedda/cybergov">main repository</a>. Consider delegating to CYBERGOV :)</p>
-"""
+    # LLM rationales are autoescaped so they cannot inject markup into the comment
+    summary_text = SUMMARY_RATIONALE_TEMPLATE.render(
+        aye_votes=aye_votes,
+        nay_votes=nay_votes,
+        abstain_votes=abstain_votes,
+        balthazar_decision=balthazar_decision,
+        balthazar_rationale=balthazar_rationale,
+        melchior_decision=melchior_decision,
+        melchior_rationale=melchior_rationale,
+        caspar_decision=caspar_decision,
+        caspar_rationale=caspar_rationale,
+        network=network,
+        proposal_id=proposal_id,
+        github_run_id=github_run_id,
+    )
     return summary_text
 
 
+def _read_s3_bytes(s3, s3_path):
+    with s3.open(s3_path, "rb") as f:
+        return f.read()
+
+
 def perform_preflight_checks(s3, proposal_s3_path, local_workspace):
     """
     Checks for required input files in S3 and locally.
@@ -115,193 +168,388 @@ def perform_preflight_checks(s3, proposal_s3_path, local_workspace):
     logger.info("01 - Performing pre-flight data checks...")
     manifest_inputs = []
 
-    # 1. Check for raw_subsquare.json in S3
+    # One LIST of the proposal prefix answers both existence checks
+    try:
+        present = {Path(p).name for p in s3.ls(proposal_s3_path, detail=False)}
+    except FileNotFoundError:
+        present = set()
+
+    # 1. Check for raw_subsquare.json and content.md in S3
     raw_subsquare_s3_path = f"{proposal_s3_path}/raw_subsquare_data.json"
-    if not s3.exists(raw_subsquare_s3_path):
+    if "raw_subsquare_data.json" not in present:
         logger.error("Something went wrong finding raw_subsquare_data.json")
-        sys.exit(1)
+        raise FileNotFoundError(
+            f"raw_subsquare_data.json not found under {proposal_s3_path}, found: {sorted(present)}"
+        )
 
-    with s3.open(raw_subsquare_s3_path, "r") as f:
-        raw_data = json.load(f)
-    required_attrs = ["referendumIndex", "title", "content", "proposer"]
-    if not all(attr in raw_data for attr in required_attrs):
-        logger.error("Something went wrong validating raw_subsquare.json")
-        sys.exit(1)
+    content_name = "content.md"
+    content_md_s3_path = f"{proposal_s3_path}/{content_name}"
+    if content_name not in present:
+        logger.error("Something went wrong finding content.md")
+        raise FileNotFoundError(
+            f"{content_name} not found under {proposal_s3_path}, found: {sorted(present)}"
+        )
+
+    # Both inputs are fetched concurrently, each is then validated, hashed and
+    # saved from the same bytes
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        raw_future = pool.submit(_read_s3_bytes, s3, raw_subsquare_s3_path)
+        content_future = pool.submit(_read_s3_bytes, s3, content_md_s3_path)
+        raw_bytes = raw_future.result()
+
+    # 2. Validate raw_subsquare.json
+    raw_data = orjson.loads(raw_bytes)
+    missing_attrs = sorted(REQUIRED_RAW_SUBSQUARE_ATTRS - raw_data.keys())
+    if missing_attrs:
+        logger.error(f"Something went wrong validating raw_subsquare.json, missing {missing_attrs}")
+        raise ValueError(
+            f"raw_subsquare_data.json is missing one of the required attributes: {missing_attrs}"
+        )
+
+    logger.info("✅ raw_subsquare.json found and validated.")
 
-    # Download, hash, and record raw_subsquare.json
     local_raw_path = local_workspace / "raw_subsquare.json"
-    try:
-        s3.download(raw_subsquare_s3_path, str(local_raw_path))
-    except Exception as e:
-        logger.error("Something went wrong downloading raw_subsquare.json")
-        sys.exit(1)
+    local_raw_path.write_bytes(raw_bytes)
     manifest_inputs.append(
         {
             "logical_name": "raw_subsquare_data",
             "s3_path": raw_subsquare_s3_path,
-            "hash": hash_file(local_raw_path),
+            "hash": hash_bytes(raw_bytes),
         }
     )
-    logger.info("✅ raw_subsquare.json found and validated.")
-
-    # 2. Check for content.md in S3
-    content_md_s3_path = f"{proposal_s3_path}/content.md"
-    if not s3.exists(content_md_s3_path):
-        logger.error("Something went wrong finding content.md")
-        sys.exit(1)
 
-    # Download, hash, and record content.md
-    local_content_path = local_workspace / Path(content_md_s3_path).name
+    # 3. Save content.md as the workspace copy the Magi read from
+    local_content_path = local_workspace / content_name
     try:
-        s3.download(content_md_s3_path, str(local_content_path))
-    except Exception as e:
-        logger.error("Something went wrong downloading content.md")
-        sys.exit(1)
+        content_bytes = content_future.result()
+        local_content_path.write_bytes(content_bytes)
+    except Exception:
+        logger.exception(f"Something went wrong downloading {content_name}")
+        raise
+    logger.info(f"✅ {content_name} found.")
+
     manifest_inputs.append(
         {
             "logical_name": "content_markdown",
             "s3_path": content_md_s3_path,
-            "hash": hash_file(local_content_path),
+            "hash": hash_bytes(content_bytes),
         }
     )
-    logger.info(f"✅ {Path(content_md_s3_path).name} found.")
 
-    # Currently useless, see run_magi_evaluations.magi_personalities
-    prompt_dir = Path("templates/system_prompts")
+    # Loads and caches the prompts for run_magi_evaluations, raises if one is missing
+    load_magi_personalities()
     magi_models = ["balthazar", "caspar", "melchior"]
-    for model in magi_models:
-        prompt_file = prompt_dir / f"{model}_system_prompt.md"
-        if not prompt_file.exists():
-            logger.error(f"Something went wrong finding {model}_system_prompt.md")
-            sys.exit(1)
     logger.info("✅ All local system prompts found.")
 
     logger.info("Pre-flight checks passed.")
     return manifest_inputs, local_content_path, magi_models
 
 
-def run_magi_evaluations(magi_models_list, local_workspace):
+def _inference_cache_key(model_id, personality_prompt, proposal_text):
+    return hashlib.sha256(
+        "\0".join(
+            (model_id, personality_prompt, proposal_text, MAGI_PROMPT_VERSION)
+        ).encode("utf-8")
+    ).hexdigest()
+
+
+def _decode_cache_entry(payload):
+    entry = orjson.loads(payload)
+    expires_at = datetime.datetime.fromisoformat(entry["expires_at"])
+    if expires_at <= datetime.datetime.now(datetime.timezone.utc):
+        return None
+    return SimpleNamespace(**entry["prediction"])
+
+
+def _prune_local_cache(local_cache_dir):
+    # Entries expire INFERENCE_CACHE_TTL after they are written, so the file mtime tells
+    # which ones are stale without parsing them
+    cutoff = (datetime.datetime.now(datetime.timezone.utc) - INFERENCE_CACHE_TTL).timestamp()
+    for cache_file in Path(local_cache_dir).glob("*.json"):
+        try:
+            if cache_file.stat().st_mtime < cutoff:
+                cache_file.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def load_cached_prediction(cache_key, local_cache_dir=None, s3=None, inference_cache_path=None):
     """
-    Runs LLM evaluations by compiling a separate, optimized agent for each Magi's model.
-    The function signature remains unchanged.
+    Looks the prediction up in the local cache first, then in the S3 cache.
+    Returns (prediction, source) on a hit and (None, None) on a miss or expired entry.
+    An expired local entry is deleted. Cache errors are logged and treated as a miss, they never fail the evaluation.
     """
-    logger.info("02 - Running MAGI V0 Evaluation (Compile-per-Model strategy)...")
-    analysis_dir = local_workspace / "llm_analyses"
-    analysis_dir.mkdir(exist_ok=True)
+    if local_cache_dir is not None:
+        cache_file = Path(local_cache_dir) / f"{cache_key}.json"
+        try:
+            if cache_file.exists():
+                prediction = _decode_cache_entry(cache_file.read_bytes())
+                if prediction is not None:
+                    return prediction, str(cache_file)
+                cache_file.unlink(missing_ok=True)
+        except Exception as e:
+            logger.warning(f"Something went wrong reading cached prediction {cache_file}: {e}")
 
-    # Load personalities from system prompt files
-    magi_personalities = load_magi_personalities()
+    if s3 is not None and inference_cache_path:
+        cache_s3_path = f"{inference_cache_path}/{cache_key}.json"
+        try:
+            if s3.exists(cache_s3_path):
+                with s3.open(cache_s3_path, "rb") as f:
+                    prediction = _decode_cache_entry(f.read())
+                if prediction is not None:
+                    return prediction, cache_s3_path
+        except Exception as e:
+            logger.warning(f"Something went wrong reading cached prediction {cache_s3_path}: {e}")
 
-    # TODO maybe pick from a random list?
-    magi_llms = {
-        "balthazar": "openrouter/openai/gpt-5",
-        "melchior": "openrouter/google/gemini-2.5-pro-preview",
-        "caspar": "openrouter/anthropic/claude-sonnet-4",
-    }
+    return None, None
 
-    proposal_content_path = local_workspace / "content.md"
-    if not proposal_content_path.exists():
-        logger.error("Something went wrong finding proposal content")
-        sys.exit(1)
-    proposal_text = proposal_content_path.read_text()
-    logger.info("  — Proposal input:\n" + proposal_text.strip())
 
+def store_cached_prediction(cache_key, prediction, local_cache_dir=None, s3=None, inference_cache_path=None):
+    """
+    Stores the prediction fields in every enabled cache tier, failures are only logged.
+    Expired entries are pruned from the local cache on each write so it does not keep growing.
+    """
+    expires_at = datetime.datetime.now(datetime.timezone.utc) + INFERENCE_CACHE_TTL
+    payload = orjson.dumps(
+        {
+            "expires_at": expires_at.isoformat(),
+            "prediction": {
+                name: getattr(prediction, name, None) for name in CACHED_PREDICTION_FIELDS
+            },
+        }
+    )
 
-    output_files = []
-    for magi_key in magi_models_list:
-        if magi_key not in magi_llms:
-            logger.warning(f"Skipping '{magi_key}': No model configured.")
-            continue
+    if local_cache_dir is not None:
+        cache_file = Path(local_cache_dir) / f"{cache_key}.json"
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            _prune_local_cache(cache_file.parent)
+            cache_file.write_bytes(payload)
+        except Exception as e:
+            logger.warning(f"Something went wrong caching prediction {cache_file}: {e}")
 
-        model_id = magi_llms[magi_key]
-        personality_prompt = magi_personalities[magi_key]
+    if s3 is not None and inference_cache_path:
+        cache_s3_path = f"{inference_cache_path}/{cache_key}.json"
+        try:
+            s3.pipe(cache_s3_path, payload)
+        except Exception as e:
+            logger.warning(f"Something went wrong caching prediction {cache_s3_path}: {e}")
+
+
+def evaluate_single_magi(
+    magi_key,
+    personality_prompt,
+    proposal_text,
+    analysis_dir,
+    timestamp_utc,
+    s3=None,
+    inference_cache_path=None,
+    local_cache_dir=None,
+):
+    """
+    Compiles the agent for one Magi, runs its inference and writes {magi_key}.json.
+    When a local cache dir or an S3 inference cache path is given, an unexpired exact
+    (model, prompt, proposal, prompt version) match is reused instead of calling the LLM,
+    and fresh predictions are stored in every enabled tier.
+    Returns the path of the written analysis file and the analysis data.
+    """
+    model_id = MAGI_LLMS[magi_key]
 
-        logger.info(f"--- Processing Magi: {magi_key.upper()} ---")
+    logger.info(f"--- Processing Magi: {magi_key.upper()} ---")
 
+    cache_tiers = dict(
+        local_cache_dir=local_cache_dir,
+        s3=s3,
+        inference_cache_path=inference_cache_path,
+    )
+    cache_key = _inference_cache_key(model_id, personality_prompt, proposal_text)
+    prediction, cache_source = None, None
+    if local_cache_dir is not None or (s3 is not None and inference_cache_path):
+        prediction, cache_source = load_cached_prediction(cache_key, **cache_tiers)
+
+    from_cache = prediction is not None
+    if from_cache:
+        logger.info(f"  ♻️ Reusing cached prediction for {magi_key} from {cache_source}")
+    else:
         # Step A: Compile a new agent specifically for this model, maybe we will need this compiled by the same LLM? idk
         logger.info(f"  Compiling agent using model: {model_id}...")
-        compiled_agent = setup_compiled_agent(model_id=model_id)
+        compiled_agent = setup_compiled_agent(
+            model_id=model_id,
+            cache_dir=str(Path(local_cache_dir) / "agents") if local_cache_dir is not None else None,
+        )
 
         # Step B: Run a single inference with the newly compiled agent
         logger.info(f"  Running inference for {magi_key}...")
         prediction = run_single_inference(
             compiled_agent, personality_prompt, proposal_text
         )
+        store_cached_prediction(cache_key, prediction, **cache_tiers)
 
-        # Step C: Log structured transparency fields and write the result to a JSON file
-        output_path = analysis_dir / f"{magi_key}.json"
-        # Log transparency fields for public auditability
-        try:
-            logger.info("  — Critical analysis:\n" + prediction.critical_analysis.strip())
-        except Exception:
-            logger.warning("  — Critical analysis not available from prediction.")
+    # Step C: Log structured transparency fields and write the result to a JSON file
+    output_path = analysis_dir / f"{magi_key}.json"
+    # Log transparency fields for public auditability, Magi run concurrently so tag each line
+    try:
+        logger.info(f"  — [{magi_key}] Critical analysis:\n" + prediction.critical_analysis.strip())
+    except Exception:
+        logger.warning(f"  — [{magi_key}] Critical analysis not available from prediction.")
 
-        try:
-            logger.info("  — Factors considered:\n" + prediction.factors_considered.strip())
-        except Exception:
-            logger.warning("  — Factors considered not available from prediction.")
+    try:
+        logger.info(f"  — [{magi_key}] Factors considered:\n" + prediction.factors_considered.strip())
+    except Exception:
+        logger.warning(f"  — [{magi_key}] Factors considered not available from prediction.")
 
-        try:
-            logger.info(f"  — Scores: {getattr(prediction, 'scores', '').strip()}")
-        except Exception:
-            logger.warning("  — Scores not available from prediction.")
+    try:
+        logger.info(f"  — [{magi_key}] Scores: {getattr(prediction, 'scores', '').strip()}")
+    except Exception:
+        logger.warning(f"  — [{magi_key}] Scores not available from prediction.")
 
-        try:
-            logger.info("  — Decision trace:\n" + prediction.decision_trace.strip())
-        except Exception:
-            logger.warning("  — Decision trace not available from prediction.")
+    try:
+        logger.info(f"  — [{magi_key}] Decision trace:\n" + prediction.decision_trace.strip())
+    except Exception:
+        logger.warning(f"  — [{magi_key}] Decision trace not available from prediction.")
 
-        try:
-            logger.info(f"  — Safety flags: {getattr(prediction, 'safety_flags', '').strip()}")
-        except Exception:
-            logger.warning("  — Safety flags not available from prediction.")
-
-        data = {
-            "model_name": model_id,
-            "timestamp_utc": datetime.datetime.now(datetime.timezone.utc).isoformat(),
-            "decision": prediction.vote.strip(),
-            "confidence": None,
-            "rationale": prediction.rationale.strip(),
-            # Structured transparency fields
-            "critical_analysis": getattr(prediction, "critical_analysis", None),
-            "factors_considered": getattr(prediction, "factors_considered", None),
-            "scores": getattr(prediction, "scores", None),
-            "decision_trace": getattr(prediction, "decision_trace", None),
-            "safety_flags": getattr(prediction, "safety_flags", None),
-            "raw_api_response": {},
-        }
-        with open(output_path, "w") as f:
-            json.dump(data, f, indent=2)
+    try:
+        logger.info(f"  — [{magi_key}] Safety flags: {getattr(prediction, 'safety_flags', '').strip()}")
+    except Exception:
+        logger.warning(f"  — [{magi_key}] Safety flags not available from prediction.")
+
+    data = {
+        "model_name": model_id,
+        "timestamp_utc": timestamp_utc,
+        "decision": prediction.vote.strip(),
+        "confidence": None,
+        "rationale": prediction.rationale.strip(),
+        # Structured transparency fields
+        "critical_analysis": getattr(prediction, "critical_analysis", None),
+        "factors_considered": getattr(prediction, "factors_considered", None),
+        "scores": getattr(prediction, "scores", None),
+        "decision_trace": getattr(prediction, "decision_trace", None),
+        "safety_flags": getattr(prediction, "safety_flags", None),
+        "from_cache": from_cache,
+        "raw_api_response": {},
+    }
+    write_json_output(output_path, data)
+
+    logger.info(
+        f"✅ Generated analysis for {magi_key} and saved to {output_path.name}"
+    )
+
+    return output_path, data
+
+
+def run_magi_evaluations(
+    magi_models_list,
+    local_workspace,
+    s3=None,
+    inference_cache_path=None,
+    local_cache_dir=None,
+    run_timestamp_utc=None,
+):
+    """
+    Runs LLM evaluations by compiling a separate, optimized agent for each Magi's model.
+    The Magi are evaluated concurrently, each one writes its own analysis file
+    as soon as it is done so completed outputs persist if another one fails.
+    Passing s3 and inference_cache_path enables the exact-match inference cache,
+    and local_cache_dir enables the on-disk inference cache. Nothing is published
+    here, the analyses are uploaded together with the manifest once the vote is done.
+    run_timestamp_utc stamps the analyses, it defaults to the start of this stage.
+    Returns the analysis paths in the order of magi_models_list, and the analysis
+    data by Magi so the vote can be consolidated without reading the files back.
+    """
+    logger.info("02 - Running MAGI V0 Evaluation (Compile-per-Model strategy)...")
+    analysis_dir = local_workspace / "llm_analyses"
+    analysis_dir.mkdir(exist_ok=True)
+    # All analyses written by this stage share the same timestamp
+    timestamp_utc = run_timestamp_utc or _utc_now_iso()
 
-        output_files.append(output_path)
-        logger.info(
-            f"✅ Generated analysis for {magi_key} and saved to {output_path.name}"
+    # Load personalities from system prompt files
+    magi_personalities = load_magi_personalities()
+
+    # Preflight saved content.md, a failed read is the only check needed
+    proposal_content_path = local_workspace / "content.md"
+    try:
+        proposal_text = proposal_content_path.read_text()
+    except FileNotFoundError:
+        logger.error("Something went wrong finding proposal content")
+        sys.exit(1)
+    logger.info("  — Proposal input:\n" + proposal_text.strip())
+
+    runnable_magi = []
+    for magi_key in magi_models_list:
+        if magi_key not in MAGI_LLMS:
+            logger.warning(f"Skipping '{magi_key}': No model configured.")
+            continue
+        runnable_magi.append(magi_key)
+
+    async def _run_all():
+        # Bound concurrency to respect per-provider rate limits
+        semaphore = asyncio.Semaphore(MAGI_MAX_CONCURRENCY)
+
+        async def _run_one(magi_key):
+            async with semaphore:
+                return await asyncio.to_thread(
+                    evaluate_single_magi,
+                    magi_key,
+                    magi_personalities[magi_key],
+                    proposal_text,
+                    analysis_dir,
+                    timestamp_utc,
+                    s3,
+                    inference_cache_path,
+                    local_cache_dir,
+                )
+
+        return await asyncio.gather(
+            *(_run_one(magi_key) for magi_key in runnable_magi),
+            return_exceptions=True,
         )
 
-    return output_files
+    results = asyncio.run(_run_all())
+
+    failures = [
+        (magi_key, result)
+        for magi_key, result in zip(runnable_magi, results)
+        if isinstance(result, BaseException)
+    ]
+    for magi_key, error in failures:
+        logger.error(f"❌ Evaluation failed for {magi_key}: {error}")
+    if failures:
+        # Never vote on a partial panel
+        raise failures[0][1]
+
+    analysis_files = [output_path for output_path, _ in results]
+    analyses = {magi_key: data for magi_key, (_, data) in zip(runnable_magi, results)}
+    return analysis_files, analyses
 
 
-def consolidate_vote(analysis_files, local_workspace, proposal_id, network):
+def _load_analysis(analysis_file):
+    # orjson parses the raw bytes directly, no intermediate str decode
+    return analysis_file.stem, orjson.loads(Path(analysis_file).read_bytes())
+
+
+def consolidate_vote(analysis_files, local_workspace, proposal_id, network, run_timestamp_utc=None, analyses=None):
     """
     Reads individual LLM analyses and creates a final vote.json file.
+    analyses maps each Magi to its analysis data when the caller already has it,
+    the analysis files are then not read back.
+    run_timestamp_utc stamps the vote, it defaults to the current time.
     """
     logger.info("03 - Consolidating vote...")
     votes_breakdown = []
-    decisions = []
-    
-    for analysis_file in analysis_files:
-        with open(analysis_file, "r") as f:
-            data = json.load(f)
-        model_name = analysis_file.stem
-        
-        decision = data["decision"].strip()
-        if decision.upper() == "AYE":
-            normalized_decision = "Aye"
-        elif decision.upper() == "NAY":
-            normalized_decision = "Nay"
-        else:  # ABSTAIN or any other value
-            normalized_decision = "Abstain"
-        
+    decision_counts = Counter()
+
+    if analyses is not None:
+        parsed_analyses = analyses
+    else:
+        # One reader per Magi so the file reads and JSON parsing overlap
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            parsed_analyses = dict(pool.map(_load_analysis, analysis_files))
+
+    for model_name, data in parsed_analyses.items():
+        normalized_decision = _NORMALIZE_DECISION.get(
+            data["decision"].strip().upper(), "Abstain"
+        )
+
         votes_breakdown.append(
             {
                 "model": model_name,
@@ -309,55 +557,42 @@ def consolidate_vote(analysis_files, local_workspace, proposal_id, network):
                 "confidence": data["confidence"],
             }
         )
-        decisions.append(normalized_decision)
+        decision_counts[normalized_decision] += 1
+
+    # A conclusive vote is only cast if there is unanimity.
+    # TODO: make use of the conclusive variable or throw it out, it is redundant
+    is_unanimous = len(decision_counts) == 1
+    is_conclusive = is_unanimous
 
-    if not decisions:
-        final_decision = "Abstain"
-        is_conclusive = False
-        is_unanimous = False
+    if is_unanimous:
+        final_decision = next(iter(decision_counts))
     else:
-        is_unanimous = len(set(decisions)) == 1
-
-        if is_unanimous:
-            # If all votes are the same, that's our final decision.
-            final_decision = decisions[0]
-            # A conclusive vote is only cast if there is unanimity.
-            # TODO: make use of the conclusive variable or throw it out, it is redundant
-            is_conclusive = True
+        # Apply decision table logic (also covers the no-decisions case):
+        # - Two Aye and one Abstain -> Aye
+        # - Two Nay and one Abstain -> Nay
+        # - Any other disagreement -> Abstain
+        aye = decision_counts["Aye"]
+        nay = decision_counts["Nay"]
+        if aye == 2 and nay == 0:
+            final_decision = "Aye"
+        elif nay == 2 and aye == 0:
+            final_decision = "Nay"
         else:
-            # Apply decision table logic:
-            # - Two Aye and one Abstain -> Aye
-            # - Two Nay and one Abstain -> Nay
-            # - Any other disagreement -> Abstain
-            counts = Counter(decisions)
-            aye = counts.get("Aye", 0)
-            nay = counts.get("Nay", 0)
-            abstain = counts.get("Abstain", 0)
-
-            if aye == 2 and nay == 0:
-                final_decision = "Aye"
-                is_conclusive = False
-            elif nay == 2 and aye == 0:
-                final_decision = "Nay"
-                is_conclusive = False
-            else:
-                final_decision = "Abstain"
-                is_conclusive = False
+            final_decision = "Abstain"
 
     vote_data = {
-        "timestamp_utc": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "timestamp_utc": run_timestamp_utc or _utc_now_iso(),
         "is_conclusive": is_conclusive,
         "final_decision": final_decision,
         "is_unanimous": is_unanimous,
         "summary_rationale": generate_summary_rationale(
-            votes_breakdown, proposal_id, network, analysis_files
+            votes_breakdown, proposal_id, network, parsed_analyses
         ),
         "votes_breakdown": votes_breakdown,
     }
 
     vote_path = local_workspace / "vote.json"
-    with open(vote_path, "w") as f:
-        json.dump(vote_data, f, indent=2)
+    write_json_output(vote_path, vote_data)
     logger.info(f"✅ Vote consolidated into {vote_path}.")
     return vote_path
 
@@ -377,10 +612,14 @@ def setup_s3_and_workspace(config):
             key=config["S3_ACCESS_KEY_ID"],
             secret=config["S3_ACCESS_KEY_SECRET"],
             client_kwargs={"endpoint_url": config["S3_ENDPOINT_URL"]},
+            # Let botocore back off and retry transient 503/SlowDown responses
+            config_kwargs={"retries": {"max_attempts": 5, "mode": "adaptive"}},
             asynchronous=False,
             loop=None,
         )
-        s3.ls(s3_bucket, detail=False, refresh=True) # Test connection
+        # Test connection without listing the whole bucket
+        if not s3.exists(s3_bucket):
+            raise FileNotFoundError(f"Bucket {s3_bucket} is not reachable")
     except Exception as e:
         logger.error("Something went wrong during S3 initialization")
         sys.exit(1)
@@ -395,36 +634,174 @@ def setup_s3_and_workspace(config):
     return s3, proposal_s3_path, local_workspace, proposal_id, network
 
 
-def upload_outputs_and_generate_manifest(s3, proposal_s3_path, local_workspace, local_analysis_files, local_vote_file, manifest_inputs):
+def output_s3_path(proposal_s3_path, local_file):
     """
-    Upload output files to S3 and generate the final manifest.
-    Returns the manifest data structure.
+    Returns the S3 destination of a local output file.
     """
-    logger.info("04 - Attesting, signing, and uploading outputs...")
-    manifest_outputs = []
-    files_to_process = local_analysis_files + [local_vote_file]
+    if local_file.parent.name == "llm_analyses":
+        s3_filename = f"llm_analyses/{local_file.stem}.json"
+    else:
+        s3_filename = f"{local_file.stem}.json"
+    return f"{proposal_s3_path}/{s3_filename}"
 
-    for local_file in files_to_process:
-        file_hash = hash_file(local_file)
 
-        if local_file.parent.name == "llm_analyses":
-            s3_filename = f"llm_analyses/{local_file.stem}.json"
-        else:
-            s3_filename = f"{local_file.stem}.json"
+def _upload_if_changed(s3, local_file, s3_path):
+    """
+    Uploads local_file unless the remote object already carries the same sha256 metadata.
+    The file is read once, the bytes that are hashed for the manifest are the ones uploaded.
+    Returns the file hash and whether an upload happened.
+    """
+    data = Path(local_file).read_bytes()
+    file_hash = hash_bytes(data)
+    try:
+        remote_hash = s3.metadata(s3_path).get("sha256")
+    except FileNotFoundError:
+        remote_hash = None
+    except Exception as e:
+        logger.warning(f"Could not read metadata of {s3_path}, uploading anyway: {e}")
+        remote_hash = None
+
+    if remote_hash == file_hash:
+        return file_hash, False
+
+    s3.pipe(s3_path, data, ContentType="application/json", Metadata={"sha256": file_hash})
+    return file_hash, True
+
+
+def load_published_manifest(s3, proposal_s3_path):
+    """
+    Returns the manifest.json previously published for this proposal, or None.
+    Any error reading it counts as a miss, the pipeline then simply runs again.
+    """
+    try:
+        return orjson.loads(s3.cat_file(f"{proposal_s3_path}/manifest.json"))
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Could not read the existing manifest, running the full pipeline: {e}")
+        return None
+
+
+def _published_prompt_version(published_manifest):
+    return published_manifest.get("provenance", {}).get("prompt_version")
+
+
+def magi_provenance():
+    """
+    Returns the model ID and the system prompt hash of each configured Magi,
+    recorded in the manifest so a changed model or prompt invalidates earlier outputs.
+    """
+    magi_personalities = load_magi_personalities()
+    return {
+        magi_key: {
+            "model": model_id,
+            "prompt_hash": hash_bytes(magi_personalities[magi_key].encode("utf-8")),
+        }
+        for magi_key, model_id in MAGI_LLMS.items()
+    }
+
 
-        final_s3_path = f"{proposal_s3_path}/{s3_filename}"
+def manifest_is_current(published_manifest, manifest_inputs):
+    """
+    Checks whether the published manifest was produced from the same inputs,
+    prompt version, Magi models and system prompts.
+    """
+    if not published_manifest:
+        return False
+    published_hashes = {i["logical_name"]: i["hash"] for i in published_manifest.get("inputs", [])}
+    current_hashes = {i["logical_name"]: i["hash"] for i in manifest_inputs}
+    return (
+        published_hashes == current_hashes
+        and _published_prompt_version(published_manifest) == MAGI_PROMPT_VERSION
+        and published_manifest.get("provenance", {}).get("magi") == magi_provenance()
+    )
+
+
+def reuse_published_analyses(s3, published_manifest, manifest_inputs, magi_models_list, local_workspace):
+    """
+    Downloads the published Magi analyses when they were produced from the same
+    content.md, prompt version, models and system prompts, so the LLM calls can be skipped.
+    Each download is checked against the hash attested in the manifest and its model.
+    Returns the local analysis paths, or None when the analyses cannot be reused.
+    """
+    if not published_manifest or _published_prompt_version(published_manifest) != MAGI_PROMPT_VERSION:
+        return None
 
+    published_inputs = {i["logical_name"]: i["hash"] for i in published_manifest.get("inputs", [])}
+    current_inputs = {i["logical_name"]: i["hash"] for i in manifest_inputs}
+    if published_inputs.get("content_markdown") != current_inputs.get("content_markdown"):
+        return None
+
+    published_magi = published_manifest.get("provenance", {}).get("magi") or {}
+    current_magi = magi_provenance()
+    if any(published_magi.get(magi_key) != current_magi.get(magi_key) for magi_key in magi_models_list):
+        return None
+
+    published_outputs = {o["logical_name"]: o for o in published_manifest.get("outputs", [])}
+    if any(magi_key not in published_outputs for magi_key in magi_models_list):
+        return None
+
+    analysis_dir = local_workspace / "llm_analyses"
+    analysis_dir.mkdir(exist_ok=True)
+    analysis_files = []
+    for magi_key in magi_models_list:
+        output = published_outputs[magi_key]
         try:
-            s3.upload(str(local_file), final_s3_path)
-            logger.info(f"  📤 Uploaded {local_file.name}")
+            data = s3.cat_file(output["s3_path"])
         except Exception as e:
-            logger.error(f"Something went wrong uploading {local_file.name}")
-            sys.exit(1)
+            logger.warning(f"Could not fetch the published {magi_key} analysis, running the evaluations: {e}")
+            return None
+        if hash_bytes(data) != output["hash"]:
+            logger.warning(f"Published {magi_key} analysis does not match its manifest hash, running the evaluations")
+            return None
+        try:
+            model_name = orjson.loads(data).get("model_name")
+        except orjson.JSONDecodeError:
+            model_name = None
+        if model_name != MAGI_LLMS[magi_key]:
+            logger.warning(f"Published {magi_key} analysis was produced by {model_name}, running the evaluations")
+            return None
+        analysis_file = analysis_dir / f"{magi_key}.json"
+        analysis_file.write_bytes(data)
+        analysis_files.append(analysis_file)
 
+    return analysis_files
+
+
+def upload_outputs_and_generate_manifest(s3, proposal_s3_path, local_workspace, local_analysis_files, local_vote_file, manifest_inputs, run_timestamp_utc=None):
+    """
+    Upload output files to S3 and generate the final manifest.
+    run_timestamp_utc stamps the provenance, it defaults to the current time.
+    Returns the manifest data structure.
+    """
+    logger.info("04 - Attesting, signing, and uploading outputs...")
+    files_to_process = local_analysis_files + [local_vote_file]
+
+    s3_paths = [
+        output_s3_path(proposal_s3_path, local_file) for local_file in files_to_process
+    ]
+
+    # Each output is hashed, compared and uploaded in its own worker, so one file's
+    # hashing overlaps the others' S3 round-trips
+    try:
+        with ThreadPoolExecutor(max_workers=len(files_to_process)) as pool:
+            results = list(
+                pool.map(functools.partial(_upload_if_changed, s3), files_to_process, s3_paths)
+            )
+    except Exception as e:
+        logger.error("Something went wrong uploading outputs")
+        sys.exit(1)
+
+    manifest_outputs = []
+    for local_file, s3_path, (file_hash, uploaded) in zip(files_to_process, s3_paths, results):
+        if uploaded:
+            logger.info(f"  📤 Uploaded {local_file.name} to {s3_path}")
+        else:
+            logger.info(f"  ⏭️ Skipped {local_file.name}, {s3_path} is already up to date")
         manifest_outputs.append(
             {
                 "logical_name": local_file.stem,
-                "s3_path": final_s3_path,
+                "s3_path": s3_path,
                 "hash": file_hash,
             }
         )
@@ -436,9 +813,9 @@ def upload_outputs_and_generate_manifest(s3, proposal_s3_path, local_workspace,
             "github_repository": os.getenv("GITHUB_REPOSITORY", "N/A"),
             "github_run_id": os.getenv("GITHUB_RUN_ID", "N/A"),
             "github_commit_sha": os.getenv("GITHUB_SHA", "N/A"),
-            "timestamp_utc": datetime.datetime.now(
-                datetime.timezone.utc
-            ).isoformat(),
+            "timestamp_utc": run_timestamp_utc or _utc_now_iso(),
+            "prompt_version": MAGI_PROMPT_VERSION,
+            "magi": magi_provenance(),
         },
         "inputs": manifest_inputs,
         "outputs": manifest_outputs,
@@ -446,18 +823,20 @@ def upload_outputs_and_generate_manifest(s3, proposal_s3_path, local_workspace,
 
     logger.info(f"Manifest outputs: {manifest['outputs']}")
     
-    canonical_manifest = json.dumps(
-        manifest, sort_keys=True, separators=(",", ":")
-    ).encode("utf-8")
+    # Same canonical form as scripts/verify_hash.py, stdlib json escapes non-ASCII
+    # characters so the bytes and the hash match it for any manifest content
+    canonical_manifest = json.dumps(manifest, sort_keys=True, separators=(",", ":")).encode("utf-8")
     canonical_manifest_sha256 = hashlib.sha256(canonical_manifest).hexdigest()
     logger.info(f"Canonical SHA256 of the manifest: {canonical_manifest_sha256}")
 
+    # Publish the exact bytes that were hashed, so a plain sha256 of the
+    # downloaded manifest.json matches the logged hash. They are sent from memory,
+    # the workspace copy is only kept for inspection
     manifest_path = local_workspace / "manifest.json"
-    with open(manifest_path, "w") as f:
-        json.dump(manifest, f, indent=2)
+    manifest_path.write_bytes(canonical_manifest)
 
     try:
-        s3.upload(str(manifest_path), f"{proposal_s3_path}/manifest.json")
+        s3.pipe(f"{proposal_s3_path}/manifest.json", canonical_manifest, ContentType="application/json")
         logger.info("✅ Uploaded manifest.")
     except Exception as e:
         logger.error("Something went wrong uploading manifest")
@@ -470,6 +849,8 @@ def main():
     logger = setup_logging()
     logger.info("CyberGov V0 ... initializing.")
     last_good_step = "initializing"
+    # One timestamp for the analyses, the vote and the manifest provenance of this run
+    run_timestamp_utc = _utc_now_iso()
 
     try:
         config = get_config_from_env()
@@ -482,16 +863,52 @@ def main():
         )
         last_good_step = "pre-flight_checks"
 
-        local_analysis_files = run_magi_evaluations(magi_models, local_workspace)
+        # BYPASS_LLM_CACHE forces a full re-evaluation, e.g. for a re-vote on unchanged content
+        bypass_cache = os.getenv("BYPASS_LLM_CACHE", "").lower() in ("1", "true")
+        published_manifest = None
+        if not bypass_cache:
+            published_manifest = load_published_manifest(s3, proposal_s3_path)
+            if manifest_is_current(published_manifest, manifest_inputs):
+                logger.info("CACHE_HIT: inputs, prompts and models match the published manifest, nothing to do.")
+                return
+
+        # Both cache tiers are opt-in since re-vote requests expect fresh inferences:
+        # CYBERGOV_CACHE_DIR points the on-disk cache at a directory that outlives the
+        # run (set by the workflow's use_llm_cache input), CYBERGOV_USE_CACHE enables
+        # the shared S3 cache
+        inference_cache_path, local_cache_dir = None, None
+        if not bypass_cache:
+            if os.getenv("CYBERGOV_CACHE_DIR"):
+                local_cache_dir = Path(os.getenv("CYBERGOV_CACHE_DIR"))
+            if os.getenv("CYBERGOV_USE_CACHE", "").lower() in ("1", "true"):
+                inference_cache_path = f"{config['S3_BUCKET_NAME']}/cache"
+
+        # Only the proposal text feeds the Magi, so their published analyses stay
+        # valid when just the raw data changed
+        analyses = None
+        local_analysis_files = reuse_published_analyses(
+            s3, published_manifest, manifest_inputs, magi_models, local_workspace
+        )
+        if local_analysis_files:
+            logger.info("02 - Reusing the published Magi analyses, content.md is unchanged.")
+        else:
+            local_analysis_files, analyses = run_magi_evaluations(
+                magi_models,
+                local_workspace,
+                s3,
+                inference_cache_path,
+                local_cache_dir,
+                run_timestamp_utc,
+            )
         last_good_step = "magi_evaluation"
 
         local_vote_file = consolidate_vote(
-            local_analysis_files, local_workspace, proposal_id, network
+            local_analysis_files, local_workspace, proposal_id, network, run_timestamp_utc, analyses
         )
         last_good_step = "vote_consolidation"
 
         upload_outputs_and_generate_manifest(
-            s3, proposal_s3_path, local_workspace, local_analysis_files, local_vote_file, manifest_inputs
+            s3, proposal_s3_path, local_workspace, local_analysis_files, local_vote_file, manifest_inputs, run_timestamp_utc
         )
         last_good_step = "attestation_and_upload"
 
@@ -1,8 +1,10 @@
 from prefect import flow, task, get_run_logger
 from prefect.blocks.system import Secret
 import httpx
+import asyncio
+import random
+import uuid
 from datetime import datetime, timedelta, timezone
-import time
 from prefect.server.schemas.filters import (
     FlowRunFilter,
     FlowRunFilterState,
@@ -20,6 +22,7 @@ from utils.constants import (
     VOTING_DEPLOYMENT_ID,
     VOTING_SCHEDULE_DELAY_MINUTES,
     GH_POLL_INTERVAL_SECONDS,
+    GH_POLL_MAX_INTERVAL_SECONDS,
     GH_POLL_STATUS_TIMEOUT_SECONDS,
     GITHUB_REPO,
     INFERENCE_FIND_RUN_TIMEOUT_SECONDS,
@@ -27,11 +30,85 @@ from utils.constants import (
 )
 
 
+class WorkflowFailedError(RuntimeError):
+    pass
+
+
+_GH_HEADERS = {"Accept": "application/vnd.github.v3+json"}
+_github_auth: dict[str, str] | None = None
+
+
+def _github_client() -> httpx.AsyncClient:
+    """
+    Client for one task, its polls reuse the pooled connection to api.github.com
+    instead of a new TCP+TLS handshake on every request.
+    """
+    return httpx.AsyncClient(timeout=30, headers=_GH_HEADERS)
+
+
+async def _github_auth_headers(refresh: bool = False) -> dict[str, str]:
+    """
+    Loads the 'github-pat' Secret block once per process, or again when refresh is set.
+    """
+    global _github_auth
+    if _github_auth is None or refresh:
+        secret = await Secret.aload("github-pat")
+        _github_auth = {"Authorization": f"Bearer {secret.get()}"}
+    return _github_auth
+
+
+async def _github_request(
+    client: httpx.AsyncClient, method: str, url: str, headers: dict | None = None, **kwargs
+) -> httpx.Response:
+    """
+    Sends an authenticated request to the GitHub API.
+    On a 401 the cached PAT is dropped and reloaded once, so a rotated
+    'github-pat' Secret is picked up without restarting the worker.
+    """
+    auth = await _github_auth_headers()
+    response = await client.request(method, url, headers={**auth, **(headers or {})}, **kwargs)
+    if response.status_code == 401:
+        auth = await _github_auth_headers(refresh=True)
+        response = await client.request(method, url, headers={**auth, **(headers or {})}, **kwargs)
+    return response
+
+
+def _poll_delay(attempt: int, response: httpx.Response | None = None) -> float:
+    """
+    Backoff between GitHub polls: starts at GH_POLL_INTERVAL_SECONDS, grows 1.5x per
+    attempt up to GH_POLL_MAX_INTERVAL_SECONDS, plus up to a second of jitter.
+    A rate-limited response is honoured through its Retry-After header instead.
+    """
+    if response is not None and response.status_code == 429:
+        retry_after = response.headers.get("Retry-After")
+        if retry_after and retry_after.isdigit():
+            return int(retry_after)
+    return min(GH_POLL_MAX_INTERVAL_SECONDS, GH_POLL_INTERVAL_SECONDS * 1.5**attempt) + random.random()
+
+
+async def _conditional_get(
+    client: httpx.AsyncClient, url: str, etag: str | None, params: dict | None = None
+):
+    """
+    GETs url with If-None-Match when an ETag is known.
+    Returns the response and the ETag to send next time. A 304 response means
+    nothing changed and is not charged against the rate limit, a 429 is returned
+    as is so the caller can wait for Retry-After.
+    """
+    headers = {"If-None-Match": etag} if etag else None
+    response = await _github_request(client, "GET", url, headers=headers, params=params)
+    if response.status_code in (304, 429):
+        return response, etag
+    response.raise_for_status()
+    return response, response.headers.get("ETag")
+
+
 @task
-def trigger_github_action_worker(proposal_id: int, network: str):
+async def trigger_github_action_worker(proposal_id: int, network: str, run_tag: str = ""):
     """
     Makes an API call to GitHub to trigger the `workflow_dispatch` event,
     passing the proposal ID and network as inputs.
+    The run_tag ends up in the run's title so find_workflow_run can identify it exactly.
     """
     logger = get_run_logger()
     logger.info(
@@ -39,7 +116,7 @@ def trigger_github_action_worker(proposal_id: int, network: str):
     )
 
     try:
-        github_pat = Secret.load("github-pat").get()
+        await _github_auth_headers()
     except ValueError:
         logger.error("Could not load 'github-pat' Secret block from Prefect.")
         raise
@@ -49,17 +126,12 @@ def trigger_github_action_worker(proposal_id: int, network: str):
 
     url = f"https://api.github.com/repos/{GITHUB_REPO}/actions/workflows/{workflow_file_name}/dispatches"
 
-    headers = {
-        "Accept": "application/vnd.github.v3+json",
-        "Authorization": f"Bearer {github_pat}",
-    }
-
-    data = {"ref": "main", "inputs": {"proposal_id": str(proposal_id)}}
+    data = {"ref": "main", "inputs": {"proposal_id": str(proposal_id), "run_tag": run_tag}}
 
     trigger_time = datetime.now(timezone.utc)
 
-    with httpx.Client() as client:
-        response = client.post(url, headers=headers, json=data)
+    async with _github_client() as client:
+        response = await _github_request(client, "POST", url, json=data)
 
     if response.status_code == 204:
         logger.info(
@@ -68,60 +140,79 @@ def trigger_github_action_worker(proposal_id: int, network: str):
         return workflow_file_name, trigger_time
     else:
         logger.error(
-            f"Failed to trigger GitHub Action. Status: {response.status_code}, Body: {response.text}"
+            f"Failed to trigger GitHub Action. Status: {response.status_code}, Body: {response.content[:512].decode('utf-8', 'replace')}"
         )
         response.raise_for_status()
 
 
 @task
-def find_workflow_run(
-    network: str, proposal_id: int, workflow_file_name: str, trigger_time: datetime
+async def find_workflow_run(
+    network: str,
+    proposal_id: int,
+    workflow_file_name: str,
+    trigger_time: datetime,
+    run_tag: str = "",
 ):
     """
     Finds the specific workflow run that was triggered after a given timestamp.
+    With a run_tag, only the run dispatched with that tag matches, so concurrent
+    dispatches for the same proposal cannot be confused.
     """
     logger = get_run_logger()
     logger.info(f"Searching for new workflow run for '{workflow_file_name}'...")
 
-    github_pat = Secret.load("github-pat").get()
     # API https://docs.github.com/en/rest/actions/workflow-runs?apiVersion=2022-11-28#list-workflow-runs-for-a-workflow
     url = f"https://api.github.com/repos/{GITHUB_REPO}/actions/workflows/{workflow_file_name}/runs"
-    headers = {
-        "Accept": "application/vnd.github.v3+json",
-        "Authorization": f"Bearer {github_pat}",
+    # GitHub filters on created server-side, the display title still has to be matched here
+    params = {
+        "event": "workflow_dispatch",
+        "branch": "main",
+        "per_page": 5,
+        "exclude_pull_requests": "true",
+        "created": f">={trigger_time.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')}",
     }
-    params = {"event": "workflow_dispatch", "branch": "main", "per_page": 5}
+    title_needle = f"#{proposal_id} on {network}".lower()
+    tag_needle = run_tag.lower()
+    seen_run_ids = set()
 
+    etag = None
+    attempt = 0
     start_time = datetime.now(timezone.utc)
-    while datetime.now(timezone.utc) - start_time < timedelta(
-        seconds=INFERENCE_FIND_RUN_TIMEOUT_SECONDS
-    ):
-        with httpx.Client() as client:
-            response = client.get(url, headers=headers, params=params)
-            response.raise_for_status()
-            runs = response.json().get("workflow_runs", [])
-
-        for run in runs:
-            # GitHub's created_at is a string like '2023-10-27T10:00:00Z'
-            created_at = datetime.fromisoformat(
-                run["created_at"].replace("Z", "+00:00")
-            )
-            display_title = run["display_title"].lower()
-            if (
-                created_at >= trigger_time
-                and f"#{proposal_id} on {network}" in display_title
-            ):
-                logger.info(f"Found matching workflow run with ID: {run['id']}")
-                return run["id"]
-
-        logger.info("No matching run found yet. Waiting...")
-        time.sleep(GH_POLL_INTERVAL_SECONDS)
+    async with _github_client() as client:
+        while datetime.now(timezone.utc) - start_time < timedelta(
+            seconds=INFERENCE_FIND_RUN_TIMEOUT_SECONDS
+        ):
+            response, etag = await _conditional_get(client, url, etag, params=params)
+            if response.status_code in (304, 429):
+                runs = []
+            else:
+                runs = response.json().get("workflow_runs", [])
+
+            for run in runs:
+                # A run's title and creation time never change, one look is enough
+                if run["id"] in seen_run_ids:
+                    continue
+                seen_run_ids.add(run["id"])
+                # Title first, the timestamp is only parsed for a candidate run.
+                # GitHub's created_at is a string like '2023-10-27T10:00:00Z'
+                display_title = run["display_title"].lower()
+                if (
+                    title_needle in display_title
+                    and tag_needle in display_title
+                    and datetime.fromisoformat(run["created_at"]) >= trigger_time
+                ):
+                    logger.info(f"Found matching workflow run with ID: {run['id']}")
+                    return run["id"]
+
+            logger.info("No matching run found yet. Waiting...")
+            await asyncio.sleep(_poll_delay(attempt, response))
+            attempt += 1
 
     raise TimeoutError("Timed out waiting to find the triggered workflow run.")
 
 
 @task
-def poll_workflow_run_status(run_id: int):
+async def poll_workflow_run_status(run_id: int):
     """
     Polls the status of a specific workflow run until it completes.
     Raises an exception if the run fails.
@@ -129,39 +220,42 @@ def poll_workflow_run_status(run_id: int):
     logger = get_run_logger()
     logger.info(f"Polling status for workflow run ID: {run_id}")
 
-    github_pat = Secret.load("github-pat").get()
     url = f"https://api.github.com/repos/{GITHUB_REPO}/actions/runs/{run_id}"
-    headers = {
-        "Accept": "application/vnd.github.v3+json",
-        "Authorization": f"Bearer {github_pat}",
-    }
+    # Only status and conclusion are read, the pull request list is dead weight
+    params = {"exclude_pull_requests": "true"}
 
+    etag = None
+    attempt = 0
     start_time = datetime.now(timezone.utc)
-    while datetime.now(timezone.utc) - start_time < timedelta(
-        seconds=GH_POLL_STATUS_TIMEOUT_SECONDS
-    ):
-        with httpx.Client() as client:
-            response = client.get(url, headers=headers)
-            response.raise_for_status()
+    async with _github_client() as client:
+        while datetime.now(timezone.utc) - start_time < timedelta(
+            seconds=GH_POLL_STATUS_TIMEOUT_SECONDS
+        ):
+            response, etag = await _conditional_get(client, url, etag, params=params)
+            if response.status_code in (304, 429):
+                # Unchanged since the last poll (or rate limited), so still not completed
+                await asyncio.sleep(_poll_delay(attempt, response))
+                attempt += 1
+                continue
             run_data = response.json()
 
-        # Docs: https://github.com/orgs/community/discussions/70540
-        status = run_data["status"]
-        conclusion = run_data["conclusion"]
+            # Docs: https://github.com/orgs/community/discussions/70540
+            status = run_data["status"]
+            conclusion = run_data["conclusion"]
 
-        logger.info(f"Run {run_id} status is '{status}'.")
+            logger.info(f"Run {run_id} status is '{status}'.")
 
-        if status == "completed":
-            logger.info(f"Run {run_id} completed with conclusion: '{conclusion}'.")
-            if conclusion == "success":
-                return conclusion
-            else:
-                error_message = f"GitHub Action run {run_id} failed with conclusion: '{conclusion}'."
-                logger.error(error_message)
-                # TODO, use FAIL(...) instead of raising some random stuff here
-                raise
+            if status == "completed":
+                logger.info(f"Run {run_id} completed with conclusion: '{conclusion}'.")
+                if conclusion == "success":
+                    return conclusion
+                else:
+                    error_message = f"GitHub Action run {run_id} failed with conclusion: '{conclusion}'."
+                    logger.error(error_message)
+                    raise WorkflowFailedError(error_message)
 
-        time.sleep(GH_POLL_INTERVAL_SECONDS)
+            await asyncio.sleep(_poll_delay(attempt))
+            attempt += 1
 
     raise TimeoutError(f"Timed out waiting for workflow run {run_id} to complete.")
 
@@ -238,23 +332,25 @@ async def github_action_trigger_and_monitor(
     Triggers a GitHub Action, waits for it to complete, and checks its status.
     """
     logger = get_run_logger()
+    run_tag = uuid.uuid4().hex
 
-    workflow_file_name, trigger_time = trigger_github_action_worker(
-        proposal_id=proposal_id, network=network
+    workflow_file_name, trigger_time = await trigger_github_action_worker(
+        proposal_id=proposal_id, network=network, run_tag=run_tag
     )
 
-    run_id = find_workflow_run(
+    run_id = await find_workflow_run(
         network=network,
         proposal_id=proposal_id,
         workflow_file_name=workflow_file_name,
         trigger_time=trigger_time,
+        run_tag=run_tag,
         wait_for=[trigger_github_action_worker],
     )
 
-    conclusion = poll_workflow_run_status(run_id=run_id, wait_for=[find_workflow_run])
+    conclusion = await poll_workflow_run_status(run_id=run_id, wait_for=[find_workflow_run])
 
     if conclusion != "success":
-        raise Exception("Problemooooo")
+        raise WorkflowFailedError(f"GitHub Action run {run_id} did not succeed: '{conclusion}'.")
 
     if schedule_vote:
         is_already_scheduled = await check_if_voting_already_scheduled(
@@ -275,7 +371,6 @@ async def github_action_trigger_and_monitor(
 
 
 if __name__ == "__main__":
-    import asyncio
     import sys
 
     if len(sys.argv) != 3:
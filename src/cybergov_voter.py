@@ -17,6 +17,7 @@ import hashlib
 import datetime
 from enum import Enum
 import json
+from concurrent.futures import ThreadPoolExecutor
 from utils.constants import (
     COMMENTING_DEPLOYMENT_ID,
     COMMENTING_SCHEDULE_DELAY_MINUTES,
@@ -208,7 +209,7 @@ def submit_transaction_sidecar(network: str, tx_hex: str) -> str:
 
     if response.status_code != 200:
         logger.error(
-            f"Submission failed with status {response.status_code}: {response.text}"
+            f"Submission failed with status {response.status_code}: {response.content[:512].decode('utf-8', 'replace')}"
         )
         response.raise_for_status()
 
@@ -248,21 +249,26 @@ def get_inference_result(
     try:
         s3 = setup_s3_filesystem(access_key, secret_key, endpoint_url)
 
-        with s3.open(vote_file_path, "rb") as f:
-            vote_data = json.load(f)
-        logger.info(f"Successfully loaded vote data from {vote_file_path}")
+        # The manifest is fetched and hashed while vote.json is read, the two
+        # S3 round-trips overlap instead of running back to back
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            remark_future = pool.submit(get_remark_hash, s3, manifest_file_path)
 
-        raw_vote = vote_data.get("final_decision", "").upper()
-        try:
-            vote_result = VoteResult(raw_vote)
-        except ValueError:
-            logger.error(f"Invalid 'final_decision' in vote.json: {raw_vote}")
-            raise ValueError(f"Invalid 'final_decision' in vote.json: {raw_vote}")
+            with s3.open(vote_file_path, "rb") as f:
+                vote_data = json.load(f)
+            logger.info(f"Successfully loaded vote data from {vote_file_path}")
+
+            raw_vote = vote_data.get("final_decision", "").upper()
+            try:
+                vote_result = VoteResult(raw_vote)
+            except ValueError:
+                logger.error(f"Invalid 'final_decision' in vote.json: {raw_vote}")
+                raise ValueError(f"Invalid 'final_decision' in vote.json: {raw_vote}")
 
-        is_unanimous = vote_data.get("is_unanimous", False)
-        conviction = CONVICTION_UNANIMOUS if is_unanimous else CONVICTION_DEFAULT
+            is_unanimous = vote_data.get("is_unanimous", False)
+            conviction = CONVICTION_UNANIMOUS if is_unanimous else CONVICTION_DEFAULT
 
-        remark_text = get_remark_hash(s3, manifest_file_path)
+            remark_text = remark_future.result()
         logger.info(f"Calculated remark (SHA256 of manifest): {remark_text}")
 
         logger.info(
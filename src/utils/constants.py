@@ -21,7 +21,8 @@ GH_WORKFLOW_NETWORK_MAPPING = {
     "paseo": "run_paseo.yml",
 }
 
-GH_POLL_INTERVAL_SECONDS = 15
+GH_POLL_INTERVAL_SECONDS = 2
+GH_POLL_MAX_INTERVAL_SECONDS = 20
 INFERENCE_FIND_RUN_TIMEOUT_SECONDS = 300
 GH_POLL_STATUS_TIMEOUT_SECONDS = 700
 
@@ -49,11 +49,15 @@ def hash_file(filepath, algorithm="sha256"):
     Calculates the hash of a file.
     Returns a string in the format 'algorithm:hex_digest'.
     """
-    h = hashlib.new(algorithm)
+    # file_digest reads into a reusable buffer and hashes via OpenSSL's accelerated path
     with open(filepath, "rb") as f:
-        while True:
-            chunk = f.read(8192)
-            if not chunk:
-                break
-            h.update(chunk)
+        h = hashlib.file_digest(f, algorithm)
     return f"{algorithm}:{h.hexdigest()}"
+
+
+def hash_bytes(data, algorithm="sha256"):
+    """
+    Calculates the hash of an in-memory payload.
+    Returns a string in the same 'algorithm:hex_digest' format as hash_file.
+    """
+    return f"{algorithm}:{hashlib.new(algorithm, data).hexdigest()}"
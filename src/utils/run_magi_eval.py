@@ -1,6 +1,14 @@
 import dspy
 import os
+import functools
 from dspy.teleprompt import BootstrapFewShot
+from utils.helpers import setup_logging
+
+logger = setup_logging()
+
+
+# Part of the inference cache key, bump it whenever the signature or the trainset change
+MAGI_PROMPT_VERSION = "1"
 
 
 # This signature remains the same.
@@ -168,10 +176,16 @@ trainset = [
 ]
 
 
-def setup_compiled_agent(model_id: str):
+@functools.lru_cache(maxsize=8)
+def setup_compiled_agent(model_id: str, cache_dir: str | None = None):
     """
-    Configures a default LM for compilation and then compiles the agent.
+    Configures an LM for compilation and then compiles the agent.
     The compiler needs an active LM to process the training examples.
+    The LM is scoped to this call and bound to the compiled agent, so agents
+    for different models can be compiled and run from separate threads.
+    Compiled agents are memoized per model, a process evaluating several
+    proposals compiles each model once. With a cache_dir, the compiled program
+    state is also saved there and reloaded by later processes.
     """
     openrouter_api_key = os.getenv("OPENROUTER_API_KEY")
     if not openrouter_api_key:
@@ -183,13 +197,29 @@ def setup_compiled_agent(model_id: str):
         api_key=openrouter_api_key,
         temperature=1.0, max_tokens=84000 ### OpenAI's reasoning models require passing temperature=1.0 and max_tokens >= 20000
     )
-    dspy.settings.configure(lm=compiler_lm)
+
+    state_path = None
+    if cache_dir:
+        safe_model_id = model_id.replace("/", "__")
+        state_path = os.path.join(cache_dir, f"{safe_model_id}-v{MAGI_PROMPT_VERSION}.json")
+        if os.path.exists(state_path):
+            compiled_magi_agent = MAGI()
+            compiled_magi_agent.load(state_path)
+            compiled_magi_agent.set_lm(compiler_lm)
+            logger.info(f"✅ Agent loaded from {state_path} for model: {model_id}")
+            return compiled_magi_agent
 
     config = dict(max_bootstrapped_demos=3, max_labeled_demos=3)
     teleprompter = BootstrapFewShot(metric=None, **config)
-    compiled_magi_agent = teleprompter.compile(MAGI(), trainset=trainset)
+    with dspy.context(lm=compiler_lm):
+        compiled_magi_agent = teleprompter.compile(MAGI(), trainset=trainset)
+    compiled_magi_agent.set_lm(compiler_lm)
+
+    if state_path:
+        os.makedirs(cache_dir, exist_ok=True)
+        compiled_magi_agent.save(state_path)
 
-    print(f"✅ Agent compiled successfully for model: {model_id}")
+    logger.info(f"✅ Agent compiled successfully for model: {model_id}")
     return compiled_magi_agent
 
 
@@ -158,6 +158,10 @@ def mock_s3_filesystem():
     
     # Default behavior - files exist
     mock_s3.exists.return_value = True
+    mock_s3.ls.side_effect = lambda path, detail=False: [
+        f"{path}/raw_subsquare_data.json",
+        f"{path}/content.md",
+    ]
     
     # Mock file contents
     def mock_open_context(path, mode='r'):
@@ -168,41 +172,25 @@ def mock_s3_filesystem():
                 "title": "Test Proposal",
                 "content": "This is a test proposal content",
                 "proposer": "test_proposer"
-            })
+            }).encode("utf-8")
         elif 'content.md' in path:
-            mock_file.__enter__.return_value.read.return_value = "# Test Proposal\n\nThis is test content."
+            mock_file.__enter__.return_value.read.return_value = b"# Test Proposal\n\nThis is test content."
         mock_file.__exit__ = MagicMock(return_value=None)
         return mock_file
     
     mock_s3.open.side_effect = mock_open_context
     
-    # Mock download - creates local files
-    def mock_download(s3_path, local_path):
-        local_file = Path(local_path)
-        local_file.parent.mkdir(parents=True, exist_ok=True)
-        if 'raw_subsquare_data.json' in s3_path:
-            content = {
-                "referendumIndex": 123,
-                "title": "Test Proposal",
-                "content": "This is a test proposal content",
-                "proposer": "test_proposer"
-            }
-            with open(local_file, 'w') as f:
-                json.dump(content, f)
-        elif 'content.md' in s3_path:
-            with open(local_file, 'w') as f:
-                f.write("# Test Proposal\n\nThis is test content.")
-    
-    mock_s3.download.side_effect = mock_download
-    
     return mock_s3
 
 
 @pytest.fixture
-def mock_system_prompts(temp_workspace):
+def mock_system_prompts(temp_workspace, monkeypatch):
     """Create mock system prompt files for testing."""
     prompts_dir = temp_workspace / "templates" / "system_prompts"
     prompts_dir.mkdir(parents=True, exist_ok=True)
+    monkeypatch.setattr(
+        "cybergov_evaluate_single_proposal_and_vote.SYSTEM_PROMPTS_DIR", prompts_dir
+    )
     
     magi_models = ["balthazar", "caspar", "melchior"]
     prompt_files = []
@@ -248,6 +236,10 @@ def mock_s3_filesystem():
     
     # Default behavior - files exist
     mock_s3.exists.return_value = True
+    mock_s3.ls.side_effect = lambda path, detail=False: [
+        f"{path}/raw_subsquare_data.json",
+        f"{path}/content.md",
+    ]
     
     # Mock file contents
     def mock_open_context(path, mode='r'):
@@ -258,41 +250,25 @@ def mock_s3_filesystem():
                 "title": "Test Proposal",
                 "content": "This is a test proposal content",
                 "proposer": "test_proposer"
-            })
+            }).encode("utf-8")
         elif 'content.md' in path:
-            mock_file.__enter__.return_value.read.return_value = "# Test Proposal\n\nThis is test content."
+            mock_file.__enter__.return_value.read.return_value = b"# Test Proposal\n\nThis is test content."
         mock_file.__exit__ = MagicMock(return_value=None)
         return mock_file
     
     mock_s3.open.side_effect = mock_open_context
     
-    # Mock download - creates local files
-    def mock_download(s3_path, local_path):
-        local_file = Path(local_path)
-        local_file.parent.mkdir(parents=True, exist_ok=True)
-        if 'raw_subsquare_data.json' in s3_path:
-            content = {
-                "referendumIndex": 123,
-                "title": "Test Proposal",
-                "content": "This is a test proposal content",
-                "proposer": "test_proposer"
-            }
-            with open(local_file, 'w') as f:
-                json.dump(content, f)
-        elif 'content.md' in s3_path:
-            with open(local_file, 'w') as f:
-                f.write("# Test Proposal\n\nThis is test content.")
-    
-    mock_s3.download.side_effect = mock_download
-    
     return mock_s3
 
 
 @pytest.fixture
-def mock_system_prompts(temp_workspace):
+def mock_system_prompts(temp_workspace, monkeypatch):
     """Create mock system prompt files for testing."""
     prompts_dir = temp_workspace / "templates" / "system_prompts"
     prompts_dir.mkdir(parents=True, exist_ok=True)
+    monkeypatch.setattr(
+        "cybergov_evaluate_single_proposal_and_vote.SYSTEM_PROMPTS_DIR", prompts_dir
+    )
     
     magi_models = ["balthazar", "caspar", "melchior"]
     prompt_files = []
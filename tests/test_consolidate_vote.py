@@ -457,3 +457,55 @@ class TestConsolidateVote:
         # Verify logging calls
         mock_logger.info.assert_any_call("03 - Consolidating vote...")
         mock_logger.info.assert_any_call(f"✅ Vote consolidated into {temp_workspace / 'vote.json'}.")
+
+    def test_rationale_html_is_escaped(self, temp_workspace, sample_analysis_data, create_analysis_files, mock_proposal_data):
+        """Test that markup in an LLM rationale cannot leak into the summary HTML."""
+        injected = dict(sample_analysis_data["balthazar_aye"])
+        injected["rationale"] = '<script>alert("x")</script> Strong proposal.'
+        file_data = {
+            "balthazar": injected,
+            "melchior": sample_analysis_data["melchior_aye"],
+            "caspar": sample_analysis_data["caspar_aye"]
+        }
+        
+        analysis_files = create_analysis_files(temp_workspace, file_data)
+        
+        vote_path = consolidate_vote(
+            analysis_files, 
+            temp_workspace, 
+            mock_proposal_data["proposal_id"], 
+            mock_proposal_data["network"]
+        )
+        
+        with open(vote_path, 'r') as f:
+            vote_data = json.load(f)
+        
+        summary = vote_data["summary_rationale"]
+        assert "<script>" not in summary
+        assert "&lt;script&gt;" in summary
+        assert "<blockquote>" in summary
+        assert f"https://{mock_proposal_data['network']}.subsquare.io/referenda/{mock_proposal_data['proposal_id']}" in summary
+
+    def test_given_analyses_are_not_reread(self, temp_workspace, sample_analysis_data, mock_proposal_data):
+        """Test that analyses passed in by the caller are used without reading the files."""
+        analyses = {
+            "balthazar": sample_analysis_data["balthazar_aye"],
+            "melchior": sample_analysis_data["melchior_aye"],
+            "caspar": sample_analysis_data["caspar_aye"]
+        }
+        # The files do not exist, any read would fail
+        analysis_files = [temp_workspace / f"{name}.json" for name in analyses]
+        
+        vote_path = consolidate_vote(
+            analysis_files,
+            temp_workspace,
+            mock_proposal_data["proposal_id"],
+            mock_proposal_data["network"],
+            analyses=analyses
+        )
+        
+        with open(vote_path, 'r') as f:
+            vote_data = json.load(f)
+        
+        assert vote_data["final_decision"] == "Aye"
+        assert [vote["model"] for vote in vote_data["votes_breakdown"]] == list(analyses)
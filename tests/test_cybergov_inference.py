@@ -0,0 +1,178 @@
+import pytest
+import asyncio
+import logging
+import httpx
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, Mock, patch
+
+import sys
+from pathlib import Path
+
+# Add src directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import cybergov_inference
+from cybergov_inference import (
+    WorkflowFailedError,
+    find_workflow_run,
+    poll_workflow_run_status,
+    trigger_github_action_worker,
+)
+
+
+@pytest.fixture(autouse=True)
+def mock_prefect_components():
+    """Mock the Prefect logger, the PAT Secret and the poll sleeps, and reset the cached PAT"""
+    secret_load = AsyncMock(
+        side_effect=lambda name: Mock(get=Mock(return_value=f"pat-{secret_load.await_count}"))
+    )
+    with patch('cybergov_inference.get_run_logger', return_value=logging.getLogger('test_logger')), \
+         patch('cybergov_inference.Secret') as mock_secret, \
+         patch('cybergov_inference.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+        mock_secret.aload = secret_load
+        cybergov_inference._github_auth = None
+        yield secret_load, mock_sleep
+    cybergov_inference._github_auth = None
+
+
+def mock_github(responses):
+    """
+    Routes the GitHub client to an in-memory transport answering with the given
+    responses in order. Returns the list the sent requests are recorded in.
+    """
+    requests = []
+    responses = iter(responses)
+
+    def handler(request):
+        requests.append(request)
+        return next(responses)
+
+    def client():
+        return httpx.AsyncClient(
+            transport=httpx.MockTransport(handler), headers=cybergov_inference._GH_HEADERS
+        )
+
+    return requests, patch('cybergov_inference._github_client', side_effect=client)
+
+
+def run_json(run_id, status, conclusion=None, etag=None):
+    headers = {"ETag": etag} if etag else None
+    return httpx.Response(200, json={"id": run_id, "status": status, "conclusion": conclusion}, headers=headers)
+
+
+class TestGitHubAuth:
+    """Tests for the PAT caching and the refresh on 401"""
+
+    def test_pat_is_reloaded_once_on_401(self, mock_prefect_components):
+        """A rotated PAT is picked up by reloading the Secret once"""
+        secret_load, _ = mock_prefect_components
+        requests, github = mock_github([httpx.Response(401), httpx.Response(204)])
+
+        with github:
+            workflow_file_name, _ = asyncio.run(
+                trigger_github_action_worker.fn(123, "polkadot", run_tag="abc")
+            )
+
+        assert workflow_file_name == "run_polkadot.yml"
+        assert secret_load.await_count == 2
+        assert [r.headers["Authorization"] for r in requests] == ["Bearer pat-1", "Bearer pat-2"]
+        assert requests[0].headers["Accept"] == "application/vnd.github.v3+json"
+
+    def test_persistent_401_is_not_retried_again(self, mock_prefect_components):
+        """A PAT that is still rejected after one reload fails instead of looping"""
+        secret_load, _ = mock_prefect_components
+        requests, github = mock_github([httpx.Response(401), httpx.Response(401)])
+
+        with github, pytest.raises(httpx.HTTPStatusError):
+            asyncio.run(trigger_github_action_worker.fn(123, "polkadot"))
+
+        assert len(requests) == 2
+        assert secret_load.await_count == 2
+
+    def test_pat_is_loaded_once_per_process(self, mock_prefect_components):
+        """Consecutive tasks reuse the cached PAT"""
+        secret_load, _ = mock_prefect_components
+        requests, github = mock_github([httpx.Response(204), run_json(1, "completed", "success")])
+
+        with github:
+            asyncio.run(trigger_github_action_worker.fn(123, "kusama"))
+            asyncio.run(poll_workflow_run_status.fn(1))
+
+        assert secret_load.await_count == 1
+        assert {r.headers["Authorization"] for r in requests} == {"Bearer pat-1"}
+
+
+class TestPollWorkflowRunStatus:
+    """Tests for the conditional status polling"""
+
+    def test_not_modified_and_rate_limited_polls_are_waited_out(self, mock_prefect_components):
+        """304s resend the ETag, 429s wait for Retry-After, the run's success is returned"""
+        _, mock_sleep = mock_prefect_components
+        requests, github = mock_github([
+            run_json(42, "in_progress", etag='W/"v1"'),
+            httpx.Response(304),
+            httpx.Response(429, headers={"Retry-After": "7"}),
+            run_json(42, "completed", "success"),
+        ])
+
+        with github:
+            conclusion = asyncio.run(poll_workflow_run_status.fn(42))
+
+        assert conclusion == "success"
+        assert "If-None-Match" not in requests[0].headers
+        assert [r.headers["If-None-Match"] for r in requests[1:]] == ['W/"v1"'] * 3
+        assert requests[0].url.params["exclude_pull_requests"] == "true"
+        assert mock_sleep.await_count == 3
+        assert mock_sleep.await_args_list[2].args[0] == 7
+
+    @pytest.mark.parametrize("conclusion", ["failure", "cancelled", "timed_out"])
+    def test_failed_conclusion_raises(self, conclusion):
+        """Any conclusion other than success raises WorkflowFailedError"""
+        _, github = mock_github([run_json(42, "completed", conclusion)])
+
+        with github, pytest.raises(WorkflowFailedError, match=conclusion):
+            asyncio.run(poll_workflow_run_status.fn(42))
+
+    def test_server_error_is_raised(self):
+        """Errors other than 304 and 429 are not swallowed by the polling loop"""
+        _, github = mock_github([httpx.Response(500)])
+
+        with github, pytest.raises(httpx.HTTPStatusError):
+            asyncio.run(poll_workflow_run_status.fn(42))
+
+
+class TestFindWorkflowRun:
+    """Tests for identifying the dispatched run"""
+
+    def runs(self, *runs):
+        return httpx.Response(200, json={"workflow_runs": list(runs)})
+
+    def run(self, run_id, title, created_at):
+        return {"id": run_id, "display_title": title, "created_at": created_at.isoformat()}
+
+    def test_run_tag_selects_the_dispatched_run(self, mock_prefect_components):
+        """Runs for the same proposal with another tag, or created before the trigger, are skipped"""
+        _, mock_sleep = mock_prefect_components
+        trigger_time = datetime.now(timezone.utc) - timedelta(minutes=1)
+        after = trigger_time + timedelta(seconds=5)
+        foreign = self.run(1, "🗳️ Process Proposal #123 on Polkadot othertag", after)
+        older = self.run(2, "🗳️ Process Proposal #123 on Polkadot mytag", trigger_time - timedelta(seconds=5))
+        other_proposal = self.run(3, "🗳️ Process Proposal #124 on Polkadot mytag", after)
+        ours = self.run(4, "🗳️ Process Proposal #123 on Polkadot mytag", after)
+        requests, github = mock_github([
+            self.runs(foreign, older, other_proposal),
+            httpx.Response(429, headers={"Retry-After": "3"}),
+            self.runs(ours, foreign, older, other_proposal),
+        ])
+
+        with github:
+            run_id = asyncio.run(
+                find_workflow_run.fn("polkadot", 123, "run_polkadot.yml", trigger_time, run_tag="mytag")
+            )
+
+        assert run_id == 4
+        assert len(requests) == 3
+        params = requests[0].url.params
+        assert params["event"] == "workflow_dispatch"
+        assert params["created"] == f">={trigger_time.strftime('%Y-%m-%dT%H:%M:%SZ')}"
+        assert mock_sleep.await_args_list[1].args[0] == 3
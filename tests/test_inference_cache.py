@@ -0,0 +1,170 @@
+import json
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock
+
+# Add the src directory to the path so we can import the module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from cybergov_evaluate_single_proposal_and_vote import evaluate_single_magi, load_cached_prediction
+
+
+class TestInferenceCache:
+    """Tests for the exact-match inference cache used by evaluate_single_magi."""
+
+    def _prediction(self, vote="Aye"):
+        return SimpleNamespace(
+            critical_analysis="- Scope: fine",
+            factors_considered="- Budget",
+            scores='{"feasibility":7}',
+            decision_trace="1) Decision: Aye",
+            safety_flags='{"prompt_injection_detected": false}',
+            vote=vote,
+            rationale="Looks good.",
+        )
+
+    def _in_memory_s3(self):
+        store = {}
+        mock_s3 = MagicMock()
+        mock_s3.exists.side_effect = lambda path: path in store
+
+        def mock_open(path, mode="rb"):
+            mock_file = MagicMock()
+            mock_file.__enter__.return_value.read.return_value = store[path]
+            return mock_file
+
+        mock_s3.open.side_effect = mock_open
+        mock_s3.pipe.side_effect = lambda path, data: store.__setitem__(path, data)
+        return mock_s3, store
+
+    @patch('cybergov_evaluate_single_proposal_and_vote.run_single_inference')
+    @patch('cybergov_evaluate_single_proposal_and_vote.setup_compiled_agent')
+    def test_miss_then_hit(self, mock_setup, mock_inference, temp_workspace):
+        """A fresh prediction is stored, then reused without calling the LLM."""
+        mock_s3, store = self._in_memory_s3()
+        mock_inference.return_value = self._prediction()
+
+        args = ("balthazar", "Polkadot must win.", "# Proposal", temp_workspace, "2025-01-01T00:00:00+00:00")
+
+        output_path, _ = evaluate_single_magi(*args, s3=mock_s3, inference_cache_path="bucket/cache")
+        assert mock_inference.call_count == 1
+        assert len(store) == 1
+        with open(output_path) as f:
+            assert json.load(f)["from_cache"] is False
+
+        output_path, _ = evaluate_single_magi(*args, s3=mock_s3, inference_cache_path="bucket/cache")
+        assert mock_inference.call_count == 1
+        assert mock_setup.call_count == 1
+        with open(output_path) as f:
+            data = json.load(f)
+        assert data["from_cache"] is True
+        assert data["decision"] == "Aye"
+        assert data["rationale"] == "Looks good."
+
+    @patch('cybergov_evaluate_single_proposal_and_vote.run_single_inference')
+    @patch('cybergov_evaluate_single_proposal_and_vote.setup_compiled_agent')
+    def test_cache_disabled_without_path(self, mock_setup, mock_inference, temp_workspace):
+        """Without a cache path the LLM is always called and S3 is untouched."""
+        mock_s3 = MagicMock()
+        mock_inference.return_value = self._prediction(vote="Nay")
+
+        for _ in range(2):
+            evaluate_single_magi(
+                "caspar", "Polkadot must outlive us all.", "# Proposal",
+                temp_workspace, "2025-01-01T00:00:00+00:00", s3=mock_s3,
+            )
+
+        assert mock_inference.call_count == 2
+        mock_s3.exists.assert_not_called()
+        mock_s3.pipe.assert_not_called()
+
+    @patch('cybergov_evaluate_single_proposal_and_vote.run_single_inference')
+    @patch('cybergov_evaluate_single_proposal_and_vote.setup_compiled_agent')
+    def test_cache_errors_fall_back_to_inference(self, mock_setup, mock_inference, temp_workspace):
+        """S3 failures on the cache path never fail the evaluation."""
+        mock_s3 = MagicMock()
+        mock_s3.exists.side_effect = OSError("S3 unavailable")
+        mock_s3.pipe.side_effect = OSError("S3 unavailable")
+        mock_inference.return_value = self._prediction()
+
+        output_path, _ = evaluate_single_magi(
+            "melchior", "Polkadot must thrive.", "# Proposal",
+            temp_workspace, "2025-01-01T00:00:00+00:00",
+            s3=mock_s3, inference_cache_path="bucket/cache",
+        )
+
+        assert mock_inference.call_count == 1
+        assert output_path.exists()
+
+    @patch('cybergov_evaluate_single_proposal_and_vote.run_single_inference')
+    @patch('cybergov_evaluate_single_proposal_and_vote.setup_compiled_agent')
+    def test_local_cache_hit(self, mock_setup, mock_inference, temp_workspace):
+        """The on-disk cache works without S3 and is reused on a re-run."""
+        cache_dir = temp_workspace / ".llm_cache"
+        mock_inference.return_value = self._prediction()
+
+        args = ("melchior", "Polkadot must thrive.", "# Proposal", temp_workspace, "2025-01-01T00:00:00+00:00")
+        evaluate_single_magi(*args, local_cache_dir=cache_dir)
+        output_path, _ = evaluate_single_magi(*args, local_cache_dir=cache_dir)
+
+        assert mock_inference.call_count == 1
+        assert len(list(cache_dir.glob("*.json"))) == 1
+        with open(output_path) as f:
+            assert json.load(f)["from_cache"] is True
+
+    @patch('cybergov_evaluate_single_proposal_and_vote.run_single_inference')
+    @patch('cybergov_evaluate_single_proposal_and_vote.setup_compiled_agent')
+    def test_expired_entry_is_a_miss(self, mock_setup, mock_inference, temp_workspace):
+        """Entries past their expires_at are ignored and refreshed."""
+        cache_dir = temp_workspace / ".llm_cache"
+        mock_inference.return_value = self._prediction()
+
+        args = ("caspar", "Polkadot must outlive us all.", "# Proposal", temp_workspace, "2025-01-01T00:00:00+00:00")
+        evaluate_single_magi(*args, local_cache_dir=cache_dir)
+
+        cache_file = next(cache_dir.glob("*.json"))
+        entry = json.loads(cache_file.read_text())
+        entry["expires_at"] = (datetime.now(timezone.utc) - timedelta(seconds=1)).isoformat()
+        cache_file.write_text(json.dumps(entry))
+
+        output_path, _ = evaluate_single_magi(*args, local_cache_dir=cache_dir)
+
+        assert mock_inference.call_count == 2
+        with open(output_path) as f:
+            assert json.load(f)["from_cache"] is False
+
+    def test_expired_local_entry_is_deleted(self, temp_workspace):
+        """Reading an expired on-disk entry removes it."""
+        cache_dir = temp_workspace / ".llm_cache"
+        cache_dir.mkdir()
+        cache_file = cache_dir / "stale.json"
+        expired_at = (datetime.now(timezone.utc) - timedelta(seconds=1)).isoformat()
+        cache_file.write_text(json.dumps({"expires_at": expired_at, "prediction": {}}))
+
+        assert load_cached_prediction("stale", local_cache_dir=cache_dir) == (None, None)
+        assert not cache_file.exists()
+
+    @patch('cybergov_evaluate_single_proposal_and_vote.run_single_inference')
+    @patch('cybergov_evaluate_single_proposal_and_vote.setup_compiled_agent')
+    def test_stale_entries_are_pruned_on_write(self, mock_setup, mock_inference, temp_workspace):
+        """Storing a prediction drops entries older than the TTL, also ones never read again."""
+        cache_dir = temp_workspace / ".llm_cache"
+        cache_dir.mkdir()
+        stale_file = cache_dir / "other-proposal.json"
+        stale_file.write_text("{}")
+        stale_mtime = (datetime.now(timezone.utc) - timedelta(days=8)).timestamp()
+        os.utime(stale_file, (stale_mtime, stale_mtime))
+        recent_file = cache_dir / "recent-proposal.json"
+        recent_file.write_text("{}")
+        mock_inference.return_value = self._prediction()
+
+        evaluate_single_magi(
+            "balthazar", "Polkadot must win.", "# Proposal",
+            temp_workspace, "2025-01-01T00:00:00+00:00", local_cache_dir=cache_dir,
+        )
+
+        assert not stale_file.exists()
+        assert recent_file.exists()
+        assert len(list(cache_dir.glob("*.json"))) == 2
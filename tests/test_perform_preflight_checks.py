@@ -16,7 +16,6 @@ class TestPerformPreflightChecks:
 
     def test_successful_preflight_checks(self, temp_workspace, mock_s3_filesystem, mock_system_prompts, mock_proposal_data):
         """Test successful preflight checks with all required files present."""
-        # Change to temp workspace to make system prompts discoverable
         original_cwd = os.getcwd()
         os.chdir(temp_workspace)
         
@@ -56,6 +55,9 @@ class TestPerformPreflightChecks:
             with open(local_content_path, 'r') as f:
                 content = f.read()
             assert "Test Proposal" in content
+
+            # Inputs are read once into memory, never downloaded a second time
+            mock_s3_filesystem.download.assert_not_called()
             
         finally:
             os.chdir(original_cwd)
@@ -66,11 +68,8 @@ class TestPerformPreflightChecks:
         os.chdir(temp_workspace)
         
         try:
-            # Configure mock to return False for raw_subsquare_data.json
-            def mock_exists(path):
-                return 'raw_subsquare_data.json' not in path
-            
-            mock_s3_filesystem.exists.side_effect = mock_exists
+            # Configure mock to list only content.md under the proposal prefix
+            mock_s3_filesystem.ls.side_effect = lambda path, detail=False: [f"{path}/content.md"]
             
             proposal_s3_path = f"test-bucket/proposals/{mock_proposal_data['network']}/{mock_proposal_data['proposal_id']}"
             
@@ -89,11 +88,8 @@ class TestPerformPreflightChecks:
         os.chdir(temp_workspace)
         
         try:
-            # Configure mock to return False for content.md
-            def mock_exists(path):
-                return 'content.md' not in path
-            
-            mock_s3_filesystem.exists.side_effect = mock_exists
+            # Configure mock to list only raw_subsquare_data.json under the proposal prefix
+            mock_s3_filesystem.ls.side_effect = lambda path, detail=False: [f"{path}/raw_subsquare_data.json"]
             
             proposal_s3_path = f"test-bucket/proposals/{mock_proposal_data['network']}/{mock_proposal_data['proposal_id']}"
             
@@ -102,10 +98,29 @@ class TestPerformPreflightChecks:
                 perform_preflight_checks(mock_s3_filesystem, proposal_s3_path, temp_workspace)
             
             assert "content.md" in str(exc_info.value)
-            
+
         finally:
             os.chdir(original_cwd)
 
+    @patch('cybergov_evaluate_single_proposal_and_vote.logger')
+    def test_content_md_read_failure(self, mock_logger, temp_workspace, mock_s3_filesystem, mock_system_prompts, mock_proposal_data):
+        """Test that a failed content.md read propagates and is not logged as found."""
+        original_open = mock_s3_filesystem.open.side_effect
+
+        def failing_open(path, mode='r'):
+            if 'content.md' in path:
+                raise OSError("connection reset")
+            return original_open(path, mode)
+
+        mock_s3_filesystem.open.side_effect = failing_open
+        proposal_s3_path = f"test-bucket/proposals/{mock_proposal_data['network']}/{mock_proposal_data['proposal_id']}"
+
+        with pytest.raises(OSError, match="connection reset"):
+            perform_preflight_checks(mock_s3_filesystem, proposal_s3_path, temp_workspace)
+
+        mock_logger.exception.assert_called_once()
+        assert "content.md found" not in str(mock_logger.info.call_args_list)
+
     def test_invalid_raw_subsquare_data(self, temp_workspace, mock_s3_filesystem, mock_system_prompts, mock_proposal_data, sample_raw_subsquare_data):
         """Test failure when raw_subsquare_data.json has missing required attributes."""
         original_cwd = os.getcwd()
@@ -118,9 +133,9 @@ class TestPerformPreflightChecks:
                 if 'raw_subsquare_data.json' in path:
                     mock_file.__enter__.return_value.read.return_value = json.dumps(
                         sample_raw_subsquare_data["missing_title"]
-                    )
+                    ).encode("utf-8")
                 elif 'content.md' in path:
-                    mock_file.__enter__.return_value.read.return_value = "# Test Content"
+                    mock_file.__enter__.return_value.read.return_value = b"# Test Content"
                 mock_file.__exit__ = MagicMock(return_value=None)
                 return mock_file
             
@@ -138,7 +153,7 @@ class TestPerformPreflightChecks:
         finally:
             os.chdir(original_cwd)
 
-    def test_missing_system_prompt_file(self, temp_workspace, mock_s3_filesystem, mock_proposal_data):
+    def test_missing_system_prompt_file(self, temp_workspace, mock_s3_filesystem, mock_proposal_data, monkeypatch):
         """Test failure when a system prompt file is missing."""
         original_cwd = os.getcwd()
         os.chdir(temp_workspace)
@@ -147,6 +162,9 @@ class TestPerformPreflightChecks:
             # Create incomplete system prompts (missing melchior)
             prompts_dir = temp_workspace / "templates" / "system_prompts"
             prompts_dir.mkdir(parents=True, exist_ok=True)
+            monkeypatch.setattr(
+                "cybergov_evaluate_single_proposal_and_vote.SYSTEM_PROMPTS_DIR", prompts_dir
+            )
             
             for model in ["balthazar", "caspar"]:  # Missing melchior
                 prompt_file = prompts_dir / f"{model}_system_prompt.md"
@@ -176,9 +194,9 @@ class TestPerformPreflightChecks:
                 if 'raw_subsquare_data.json' in path:
                     mock_file.__enter__.return_value.read.return_value = json.dumps(
                         sample_raw_subsquare_data["empty_data"]
-                    )
+                    ).encode("utf-8")
                 elif 'content.md' in path:
-                    mock_file.__enter__.return_value.read.return_value = "# Test Content"
+                    mock_file.__enter__.return_value.read.return_value = b"# Test Content"
                 mock_file.__exit__ = MagicMock(return_value=None)
                 return mock_file
             
@@ -207,28 +225,14 @@ class TestPerformPreflightChecks:
                 if 'raw_subsquare_data.json' in path:
                     mock_file.__enter__.return_value.read.return_value = json.dumps(
                         sample_raw_subsquare_data["valid_data"]
-                    )
+                    ).encode("utf-8")
                 elif 'content.md' in path:
-                    mock_file.__enter__.return_value.read.return_value = "# Test Content"
+                    mock_file.__enter__.return_value.read.return_value = b"# Test Content"
                 mock_file.__exit__ = MagicMock(return_value=None)
                 return mock_file
             
             mock_s3_filesystem.open.side_effect = mock_open_context
             
-            # Update download mock to handle the valid data
-            def mock_download(s3_path, local_path):
-                local_file = Path(local_path)
-                local_file.parent.mkdir(parents=True, exist_ok=True)
-                if 'raw_subsquare_data.json' in s3_path:
-                    with open(local_file, 'w') as f:
-                        json.dump(sample_raw_subsquare_data["valid_data"], f)
-                elif 'content.md' in s3_path:
-                    with open(local_file, 'w') as f:
-                        f.write("# Test Content")
-            
-            mock_s3_filesystem.open.side_effect = mock_open_context
-            mock_s3_filesystem.download.side_effect = mock_download
-            
             proposal_s3_path = f"test-bucket/proposals/{mock_proposal_data['network']}/{mock_proposal_data['proposal_id']}"
             
             # Should succeed
@@ -277,12 +281,16 @@ class TestPerformPreflightChecks:
             # Call perform_preflight_checks
             perform_preflight_checks(mock_s3_filesystem, proposal_s3_path, temp_workspace)
             
-            # Verify S3 exists calls were made with correct paths
+            # Verify a single listing of the proposal prefix replaced per-file exists calls
+            mock_s3_filesystem.ls.assert_called_once_with(proposal_s3_path, detail=False)
+            mock_s3_filesystem.exists.assert_not_called()
+            
+            # Verify the inputs were read from the expected paths
             expected_raw_path = f"{proposal_s3_path}/raw_subsquare_data.json"
             expected_content_path = f"{proposal_s3_path}/content.md"
             
-            mock_s3_filesystem.exists.assert_any_call(expected_raw_path)
-            mock_s3_filesystem.exists.assert_any_call(expected_content_path)
+            mock_s3_filesystem.open.assert_any_call(expected_raw_path, "rb")
+            mock_s3_filesystem.open.assert_any_call(expected_content_path, "rb")
             
         finally:
             os.chdir(original_cwd)
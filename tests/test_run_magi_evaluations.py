@@ -0,0 +1,109 @@
+import pytest
+import json
+import os
+import sys
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+# Add the src directory to the path so we can import the module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from cybergov_evaluate_single_proposal_and_vote import MAGI_LLMS, run_magi_evaluations
+
+# An exception escaping a worker thread must fail the test, not just warn
+pytestmark = pytest.mark.filterwarnings("error::pytest.PytestUnhandledThreadExceptionWarning")
+
+MAGI_MODELS = ["balthazar", "caspar", "melchior"]
+
+
+class ConcurrencyTracker:
+    """Stands in for run_single_inference and records how many calls overlap."""
+
+    def __init__(self, failing_magi=None, duration=0.1):
+        self.failing_magi = failing_magi
+        self.duration = duration
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+
+    def __call__(self, compiled_agent, personality_prompt, proposal_text):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.duration)
+            if self.failing_magi and self.failing_magi.title() in personality_prompt:
+                raise RuntimeError(f"{self.failing_magi} provider error")
+            return SimpleNamespace(vote="Aye", rationale="Looks good.")
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+@pytest.fixture
+def proposal_workspace(temp_workspace, mock_system_prompts):
+    (temp_workspace / "content.md").write_text("# Test Proposal\n\nThis is test content.")
+    return temp_workspace
+
+
+class TestRunMagiEvaluations:
+    """Tests for the concurrent evaluation of the Magi panel."""
+
+    @pytest.mark.parametrize("max_concurrency", [1, 2, 3])
+    @patch('cybergov_evaluate_single_proposal_and_vote.setup_compiled_agent')
+    def test_concurrency_limit_is_respected(self, mock_setup, max_concurrency, proposal_workspace):
+        """No more than MAGI_MAX_CONCURRENCY inferences run at the same time."""
+        tracker = ConcurrencyTracker()
+
+        with patch('cybergov_evaluate_single_proposal_and_vote.run_single_inference', side_effect=tracker), \
+             patch('cybergov_evaluate_single_proposal_and_vote.MAGI_MAX_CONCURRENCY', max_concurrency):
+            run_magi_evaluations(MAGI_MODELS, proposal_workspace)
+
+        assert tracker.max_active == max_concurrency
+
+    @patch('cybergov_evaluate_single_proposal_and_vote.setup_compiled_agent')
+    def test_all_analyses_are_written(self, mock_setup, proposal_workspace):
+        """Every Magi writes its analysis, all stamped with the run timestamp."""
+        tracker = ConcurrencyTracker(duration=0)
+        timestamp = "2025-01-01T00:00:00+00:00"
+
+        with patch('cybergov_evaluate_single_proposal_and_vote.run_single_inference', side_effect=tracker):
+            analysis_files, analyses = run_magi_evaluations(
+                MAGI_MODELS, proposal_workspace, run_timestamp_utc=timestamp
+            )
+
+        assert analysis_files == [proposal_workspace / "llm_analyses" / f"{magi}.json" for magi in MAGI_MODELS]
+        for magi, analysis_file in zip(MAGI_MODELS, analysis_files):
+            data = json.loads(analysis_file.read_text())
+            assert data["model_name"] == MAGI_LLMS[magi]
+            assert data["decision"] == "Aye"
+            assert data["timestamp_utc"] == timestamp
+            assert analyses[magi] == data
+        assert sorted(c.kwargs["model_id"] for c in mock_setup.call_args_list) == sorted(MAGI_LLMS.values())
+
+    @patch('cybergov_evaluate_single_proposal_and_vote.setup_compiled_agent')
+    def test_one_failing_magi_raises(self, mock_setup, proposal_workspace):
+        """A single failed evaluation fails the stage, the other analyses are still written."""
+        tracker = ConcurrencyTracker(failing_magi="melchior", duration=0)
+
+        with patch('cybergov_evaluate_single_proposal_and_vote.run_single_inference', side_effect=tracker), \
+             pytest.raises(RuntimeError, match="melchior provider error"):
+            run_magi_evaluations(MAGI_MODELS, proposal_workspace)
+
+        analysis_dir = proposal_workspace / "llm_analyses"
+        assert sorted(p.stem for p in analysis_dir.glob("*.json")) == ["balthazar", "caspar"]
+
+    @patch('cybergov_evaluate_single_proposal_and_vote.setup_compiled_agent')
+    def test_unconfigured_magi_is_skipped(self, mock_setup, proposal_workspace):
+        """A Magi without a configured model is skipped instead of failing the panel."""
+        tracker = ConcurrencyTracker(duration=0)
+
+        with patch('cybergov_evaluate_single_proposal_and_vote.run_single_inference', side_effect=tracker), \
+             patch.dict('cybergov_evaluate_single_proposal_and_vote.MAGI_LLMS', clear=True,
+                        values={"balthazar": "openrouter/openai/gpt-5"}):
+            analysis_files, analyses = run_magi_evaluations(MAGI_MODELS, proposal_workspace)
+
+        assert analysis_files == [proposal_workspace / "llm_analyses" / "balthazar.json"]
+        assert list(analyses) == ["balthazar"]
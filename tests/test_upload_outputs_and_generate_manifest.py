@@ -1,5 +1,6 @@
 import pytest
 import json
+import hashlib
 import os
 import sys
 from pathlib import Path
@@ -9,7 +10,20 @@ from datetime import datetime, timezone
 # Add the src directory to the path so we can import the module
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from cybergov_evaluate_single_proposal_and_vote import upload_outputs_and_generate_manifest
+from cybergov_evaluate_single_proposal_and_vote import (
+    MAGI_LLMS,
+    load_magi_personalities,
+    load_published_manifest,
+    manifest_is_current,
+    reuse_published_analyses,
+    upload_outputs_and_generate_manifest,
+    write_json_output,
+)
+from utils.helpers import hash_bytes
+
+
+def sha256_of(path):
+    return "sha256:" + hashlib.sha256(Path(path).read_bytes()).hexdigest()
 
 
 class TestUploadOutputsAndGenerateManifest:
@@ -60,30 +74,40 @@ class TestUploadOutputsAndGenerateManifest:
         
         proposal_s3_path = "test-bucket/proposals/polkadot/123"
         
-        with patch('cybergov_evaluate_single_proposal_and_vote.hash_file') as mock_hash_file:
-            mock_hash_file.side_effect = lambda x: f"hash-{x.stem}"
-            
-            with patch.dict(os.environ, {
-                'GITHUB_REPOSITORY': 'test/repo',
-                'GITHUB_RUN_ID': '12345',
-                'GITHUB_SHA': 'abcdef123456'
-            }):
-                # Call the function
-                manifest = upload_outputs_and_generate_manifest(
-                    mock_s3, proposal_s3_path, temp_workspace, 
-                    analysis_files, vote_file, manifest_inputs
-                )
-        
-        # Verify S3 uploads were called
+        with patch.dict(os.environ, {
+            'GITHUB_REPOSITORY': 'test/repo',
+            'GITHUB_RUN_ID': '12345',
+            'GITHUB_SHA': 'abcdef123456'
+        }):
+            # Call the function
+            manifest = upload_outputs_and_generate_manifest(
+                mock_s3, proposal_s3_path, temp_workspace, 
+                analysis_files, vote_file, manifest_inputs
+            )
+        
+        # Verify S3 uploads: the bytes of each output tagged with their hash, then the manifest
+        manifest_s3_path = f"{proposal_s3_path}/manifest.json"
         expected_uploads = [
-            ("llm_analyses/balthazar.json", f"{proposal_s3_path}/llm_analyses/balthazar.json"),
-            ("llm_analyses/melchior.json", f"{proposal_s3_path}/llm_analyses/melchior.json"),
-            ("llm_analyses/caspar.json", f"{proposal_s3_path}/llm_analyses/caspar.json"),
-            ("vote.json", f"{proposal_s3_path}/vote.json"),
-            ("manifest.json", f"{proposal_s3_path}/manifest.json")
+            (output_s3_path, local_file.read_bytes(), sha256_of(local_file), "application/json")
+            for output_s3_path, local_file in [
+                (f"{proposal_s3_path}/llm_analyses/balthazar.json", analysis_files[0]),
+                (f"{proposal_s3_path}/llm_analyses/melchior.json", analysis_files[1]),
+                (f"{proposal_s3_path}/llm_analyses/caspar.json", analysis_files[2]),
+                (f"{proposal_s3_path}/vote.json", vote_file),
+            ]
         ]
         
-        assert mock_s3.upload.call_count == 5
+        mock_s3.upload.assert_not_called()
+        assert mock_s3.pipe.call_count == 5
+        output_uploads = sorted(
+            (c.args[0], c.args[1], c.kwargs["Metadata"]["sha256"], c.kwargs["ContentType"])
+            for c in mock_s3.pipe.call_args_list
+            if c.args[0] != manifest_s3_path
+        )
+        assert output_uploads == sorted(expected_uploads)
+        mock_s3.pipe.assert_any_call(
+            manifest_s3_path, (temp_workspace / "manifest.json").read_bytes(), ContentType="application/json"
+        )
         
         # Verify manifest structure
         assert "provenance" in manifest
@@ -110,13 +134,13 @@ class TestUploadOutputsAndGenerateManifest:
         assert len(analysis_outputs) == 3
         
         for output in analysis_outputs:
-            assert output["s3_path"].startswith(f"{proposal_s3_path}/llm_analyses/")
-            assert output["hash"].startswith("hash-")
+            assert output["s3_path"] == f"{proposal_s3_path}/llm_analyses/{output['logical_name']}.json"
+            assert output["hash"] == sha256_of(analysis_dir / f"{output['logical_name']}.json")
         
         # Check vote file output
         vote_output = next(o for o in outputs if o["logical_name"] == "vote")
         assert vote_output["s3_path"] == f"{proposal_s3_path}/vote.json"
-        assert vote_output["hash"] == "hash-vote"
+        assert vote_output["hash"] == sha256_of(vote_file)
         
         # Verify manifest.json was created locally
         manifest_path = temp_workspace / "manifest.json"
@@ -137,16 +161,13 @@ class TestUploadOutputsAndGenerateManifest:
         manifest_inputs = []
         proposal_s3_path = "test-bucket/proposals/polkadot/123"
         
-        with patch('cybergov_evaluate_single_proposal_and_vote.hash_file') as mock_hash_file:
-            mock_hash_file.return_value = "hash-vote"
-            
-            manifest = upload_outputs_and_generate_manifest(
-                mock_s3, proposal_s3_path, temp_workspace, 
-                [], vote_file, manifest_inputs
-            )
+        manifest = upload_outputs_and_generate_manifest(
+            mock_s3, proposal_s3_path, temp_workspace, 
+            [], vote_file, manifest_inputs
+        )
         
         # Should upload vote file and manifest only
-        assert mock_s3.upload.call_count == 2
+        assert mock_s3.pipe.call_count == 2
         
         # Should have only one output (vote file)
         assert len(manifest["outputs"]) == 1
@@ -173,13 +194,10 @@ class TestUploadOutputsAndGenerateManifest:
         mock_s3 = MagicMock()
         proposal_s3_path = "test-bucket/proposals/polkadot/123"
         
-        with patch('cybergov_evaluate_single_proposal_and_vote.hash_file') as mock_hash_file:
-            mock_hash_file.side_effect = lambda x: f"hash-{x.stem}"
-            
-            manifest = upload_outputs_and_generate_manifest(
-                mock_s3, proposal_s3_path, temp_workspace, 
-                [analysis_file], other_file, []  # Using other_file as vote_file
-            )
+        manifest = upload_outputs_and_generate_manifest(
+            mock_s3, proposal_s3_path, temp_workspace, 
+            [analysis_file], other_file, []  # Using other_file as vote_file
+        )
         
         # Verify S3 paths
         outputs = manifest["outputs"]
@@ -200,19 +218,16 @@ class TestUploadOutputsAndGenerateManifest:
         
         mock_s3 = MagicMock()
         
-        with patch('cybergov_evaluate_single_proposal_and_vote.hash_file') as mock_hash_file:
-            mock_hash_file.return_value = "test-hash"
-            
-            # Test with no environment variables
-            with patch.dict(os.environ, {}, clear=True):
-                manifest = upload_outputs_and_generate_manifest(
-                    mock_s3, "test-path", temp_workspace, [], vote_file, []
-                )
-            
-            provenance = manifest["provenance"]
-            assert provenance["github_repository"] == "N/A"
-            assert provenance["github_run_id"] == "N/A"
-            assert provenance["github_commit_sha"] == "N/A"
+        # Test with no environment variables
+        with patch.dict(os.environ, {}, clear=True):
+            manifest = upload_outputs_and_generate_manifest(
+                mock_s3, "test-path", temp_workspace, [], vote_file, []
+            )
+        
+        provenance = manifest["provenance"]
+        assert provenance["github_repository"] == "N/A"
+        assert provenance["github_run_id"] == "N/A"
+        assert provenance["github_commit_sha"] == "N/A"
 
     @patch('cybergov_evaluate_single_proposal_and_vote.logger')
     def test_logging_output(self, mock_logger, temp_workspace):
@@ -224,12 +239,9 @@ class TestUploadOutputsAndGenerateManifest:
         
         mock_s3 = MagicMock()
         
-        with patch('cybergov_evaluate_single_proposal_and_vote.hash_file') as mock_hash_file:
-            mock_hash_file.return_value = "test-hash"
-            
-            upload_outputs_and_generate_manifest(
-                mock_s3, "test-path", temp_workspace, [], vote_file, []
-            )
+        upload_outputs_and_generate_manifest(
+            mock_s3, "test-path", temp_workspace, [], vote_file, []
+        )
         
         # Verify logging calls
         mock_logger.info.assert_any_call("04 - Attesting, signing, and uploading outputs...")
@@ -245,18 +257,64 @@ class TestUploadOutputsAndGenerateManifest:
         
         mock_s3 = MagicMock()
         
-        with patch('cybergov_evaluate_single_proposal_and_vote.hash_file') as mock_hash_file:
-            mock_hash_file.return_value = "actual-file-hash"
-            
-            manifest = upload_outputs_and_generate_manifest(
-                mock_s3, "test-path", temp_workspace, [], vote_file, []
-            )
+        manifest = upload_outputs_and_generate_manifest(
+            mock_s3, "test-path", temp_workspace, [], vote_file, []
+        )
+        
+        # Verify the hash of the file is in the manifest and on the uploaded object
+        assert manifest["outputs"][0]["hash"] == sha256_of(vote_file)
+        vote_upload = next(c for c in mock_s3.pipe.call_args_list if c.args[0] == "test-path/vote.json")
+        assert vote_upload.kwargs["Metadata"] == {"sha256": sha256_of(vote_file)}
+
+    def test_unchanged_outputs_are_not_reuploaded(self, temp_workspace):
+        """Test that outputs whose remote sha256 metadata matches are skipped."""
+        analysis_dir = temp_workspace / "llm_analyses"
+        analysis_dir.mkdir(exist_ok=True)
+        analysis_file = analysis_dir / "balthazar.json"
+        with open(analysis_file, 'w') as f:
+            json.dump({"decision": "Aye"}, f)
+        vote_file = temp_workspace / "vote.json"
+        with open(vote_file, 'w') as f:
+            json.dump({"final_decision": "Aye"}, f)
         
-        # Verify hash_file was called with the correct file
-        mock_hash_file.assert_called_with(vote_file)
+        proposal_s3_path = "test-bucket/proposals/polkadot/123"
+        remote_metadata = {f"{proposal_s3_path}/llm_analyses/balthazar.json": {"sha256": sha256_of(analysis_file)}}
+        
+        mock_s3 = MagicMock()
+        
+        def mock_metadata(path):
+            if path not in remote_metadata:
+                raise FileNotFoundError(path)
+            return remote_metadata[path]
+        
+        mock_s3.metadata.side_effect = mock_metadata
         
-        # Verify hash is in manifest
-        assert manifest["outputs"][0]["hash"] == "actual-file-hash"
+        manifest = upload_outputs_and_generate_manifest(
+            mock_s3, proposal_s3_path, temp_workspace, [analysis_file], vote_file, []
+        )
+        
+        uploaded = [c.args[0] for c in mock_s3.pipe.call_args_list]
+        assert uploaded == [f"{proposal_s3_path}/vote.json", f"{proposal_s3_path}/manifest.json"]
+        
+        # Skipped outputs are still attested in the manifest
+        assert [o["hash"] for o in manifest["outputs"]] == [sha256_of(analysis_file), sha256_of(vote_file)]
+
+    def test_attested_hash_is_taken_from_the_uploaded_bytes(self, temp_workspace):
+        """Test that the manifest hash is the hash of the bytes that were uploaded."""
+        vote_file = temp_workspace / "vote.json"
+        write_json_output(vote_file, {"final_decision": "Aye"})
+        # A file rewritten after it was written by the pipeline is attested as uploaded
+        vote_file.write_text('{"final_decision": "Nay", "rewritten": true}')
+        
+        mock_s3 = MagicMock()
+        manifest = upload_outputs_and_generate_manifest(
+            mock_s3, "test-path", temp_workspace, [], vote_file, []
+        )
+        
+        vote_upload = next(c for c in mock_s3.pipe.call_args_list if c.args[0] == "test-path/vote.json")
+        uploaded_hash = "sha256:" + hashlib.sha256(vote_upload.args[1]).hexdigest()
+        assert vote_upload.args[1] == b'{"final_decision": "Nay", "rewritten": true}'
+        assert manifest["outputs"][0]["hash"] == uploaded_hash
 
     def test_manifest_timestamp_format(self, temp_workspace):
         """Test that manifest timestamp is in correct ISO format."""
@@ -266,15 +324,146 @@ class TestUploadOutputsAndGenerateManifest:
         
         mock_s3 = MagicMock()
         
-        with patch('cybergov_evaluate_single_proposal_and_vote.hash_file') as mock_hash_file:
-            mock_hash_file.return_value = "test-hash"
-            
-            manifest = upload_outputs_and_generate_manifest(
-                mock_s3, "test-path", temp_workspace, [], vote_file, []
-            )
+        manifest = upload_outputs_and_generate_manifest(
+            mock_s3, "test-path", temp_workspace, [], vote_file, []
+        )
         
         timestamp = manifest["provenance"]["timestamp_utc"]
         
         # Should be able to parse as ISO format
         parsed_timestamp = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
         assert parsed_timestamp.tzinfo is not None
+
+    @patch('cybergov_evaluate_single_proposal_and_vote.logger')
+    def test_non_ascii_manifest_hash_matches_verify_script(self, mock_logger, temp_workspace):
+        """The logged manifest hash is the one scripts/verify_hash.py computes, also for non-ASCII content."""
+        sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+        from verify_hash import verify_canonical_json_hash
+
+        vote_file = temp_workspace / "vote.json"
+        write_json_output(vote_file, {"final_decision": "Aye"})
+        manifest_inputs = [
+            {"logical_name": "content_markdown", "s3_path": "p/Référendum — ünïcødé 🗳️.md", "hash": "sha256:bbb"},
+        ]
+
+        mock_s3 = MagicMock()
+        mock_s3.metadata.side_effect = FileNotFoundError
+        upload_outputs_and_generate_manifest(
+            mock_s3, "p", temp_workspace, [], vote_file, manifest_inputs
+        )
+
+        logged_hash = next(
+            c.args[0].rsplit(" ", 1)[-1]
+            for c in mock_logger.info.call_args_list
+            if c.args[0].startswith("Canonical SHA256 of the manifest")
+        )
+        manifest_path = temp_workspace / "manifest.json"
+        assert hashlib.sha256(manifest_path.read_bytes()).hexdigest() == logged_hash
+
+        with pytest.raises(SystemExit) as exc_info:
+            verify_canonical_json_hash(str(manifest_path), logged_hash)
+        assert exc_info.value.code == 0
+
+    def _publish(self, temp_workspace, manifest_inputs, analysis_files=()):
+        """Runs the upload step against an in-memory bucket and returns its contents."""
+        vote_file = temp_workspace / "vote.json"
+        write_json_output(vote_file, {"final_decision": "Aye"})
+
+        published = {}
+        mock_s3 = MagicMock()
+        mock_s3.metadata.side_effect = FileNotFoundError
+        mock_s3.pipe.side_effect = lambda remote, data, **kwargs: published.__setitem__(remote, data)
+        upload_outputs_and_generate_manifest(
+            mock_s3, "p", temp_workspace, list(analysis_files), vote_file, manifest_inputs
+        )
+
+        def mock_cat_file(path):
+            if path not in published:
+                raise FileNotFoundError(path)
+            return published[path]
+
+        mock_s3.cat_file.side_effect = mock_cat_file
+        return mock_s3, published
+
+    def _manifest_inputs(self, content_hash="sha256:bbb", raw_hash="sha256:aaa"):
+        return [
+            {"logical_name": "raw_subsquare_data", "s3_path": "p/raw_subsquare_data.json", "hash": raw_hash},
+            {"logical_name": "content_markdown", "s3_path": "p/content.md", "hash": content_hash},
+        ]
+
+    def test_manifest_is_current(self, temp_workspace):
+        """A published manifest with the same input hashes and prompt version is reused."""
+        manifest_inputs = self._manifest_inputs()
+        mock_s3, _ = self._publish(temp_workspace, manifest_inputs)
+
+        published_manifest = load_published_manifest(mock_s3, "p")
+        assert manifest_is_current(published_manifest, manifest_inputs)
+        assert not manifest_is_current(published_manifest, self._manifest_inputs(content_hash="sha256:ccc"))
+        assert load_published_manifest(mock_s3, "other") is None
+        assert not manifest_is_current(None, manifest_inputs)
+
+        with patch('cybergov_evaluate_single_proposal_and_vote.MAGI_PROMPT_VERSION', "next"):
+            assert not manifest_is_current(published_manifest, manifest_inputs)
+
+        # A swapped model or an edited system prompt needs fresh evaluations
+        with patch.dict('cybergov_evaluate_single_proposal_and_vote.MAGI_LLMS', {"caspar": "openrouter/other/model"}):
+            assert not manifest_is_current(published_manifest, manifest_inputs)
+        edited_personalities = dict(load_magi_personalities(), melchior="An edited prompt")
+        with patch('cybergov_evaluate_single_proposal_and_vote.load_magi_personalities', return_value=edited_personalities):
+            assert not manifest_is_current(published_manifest, manifest_inputs)
+
+    def test_reuse_published_analyses(self, temp_workspace):
+        """Analyses of an unchanged content.md are downloaded and verified instead of re-evaluated."""
+        analysis_dir = temp_workspace / "llm_analyses"
+        analysis_dir.mkdir(exist_ok=True)
+        magi_models = ["balthazar", "caspar", "melchior"]
+        analysis_files = []
+        for magi in magi_models:
+            analysis_file = analysis_dir / f"{magi}.json"
+            write_json_output(
+                analysis_file, {"model_name": MAGI_LLMS[magi], "decision": "Aye", "rationale": f"From {magi}"}
+            )
+            analysis_files.append(analysis_file)
+
+        mock_s3, published = self._publish(temp_workspace, self._manifest_inputs(), analysis_files)
+        published_manifest = load_published_manifest(mock_s3, "p")
+        for analysis_file in analysis_files:
+            analysis_file.unlink()
+
+        # Only the raw data changed, the analyses are still valid
+        reused = reuse_published_analyses(
+            mock_s3, published_manifest, self._manifest_inputs(raw_hash="sha256:new"), magi_models, temp_workspace
+        )
+        assert reused == analysis_files
+        assert json.loads(reused[0].read_text())["rationale"] == "From balthazar"
+
+        # A different proposal text needs fresh evaluations
+        assert reuse_published_analyses(
+            mock_s3, published_manifest, self._manifest_inputs(content_hash="sha256:new"), magi_models, temp_workspace
+        ) is None
+
+        # A swapped model or an edited system prompt needs fresh evaluations
+        with patch.dict('cybergov_evaluate_single_proposal_and_vote.MAGI_LLMS', {"caspar": "openrouter/other/model"}):
+            assert reuse_published_analyses(
+                mock_s3, published_manifest, self._manifest_inputs(), magi_models, temp_workspace
+            ) is None
+        edited_personalities = dict(load_magi_personalities(), melchior="An edited prompt")
+        with patch('cybergov_evaluate_single_proposal_and_vote.load_magi_personalities', return_value=edited_personalities):
+            assert reuse_published_analyses(
+                mock_s3, published_manifest, self._manifest_inputs(), magi_models, temp_workspace
+            ) is None
+
+        # An analysis from another model than the one it is attested for is rejected
+        other_model = json.dumps({"model_name": "openrouter/other/model", "decision": "Aye"}).encode()
+        stale_manifest = json.loads(json.dumps(published_manifest))
+        next(o for o in stale_manifest["outputs"] if o["logical_name"] == "caspar")["hash"] = hash_bytes(other_model)
+        published["p/llm_analyses/caspar.json"] = other_model
+        assert reuse_published_analyses(
+            mock_s3, stale_manifest, self._manifest_inputs(), magi_models, temp_workspace
+        ) is None
+
+        # A tampered analysis is rejected
+        published["p/llm_analyses/caspar.json"] = b'{"decision": "Nay"}'
+        assert reuse_published_analyses(
+            mock_s3, published_manifest, self._manifest_inputs(), magi_models, temp_workspace
+        ) is None